@@ -9,23 +9,42 @@ Usage:
     editwheel edit <wheel>  # Modify metadata fields and save
 """
 
-import argparse
+from __future__ import annotations
+
 import json
 import os
 import sys
 from importlib.metadata import version as _pkg_version
+from types import SimpleNamespace
 from typing import List, Optional
 
+# argparse is imported lazily in _build_parser: importing it and building
+# the full parser dominates cold-start time for trivial invocations, and
+# the `show` fast path below avoids both.
+
 from editwheel.editwheel import WheelEditor
 
 __version__ = _pkg_version("editwheel")
 
-
-def _existing_path(path: str) -> str:
-    """Argparse type that validates the path exists."""
-    if not os.path.exists(path):
-        raise argparse.ArgumentTypeError(f"path '{path}' does not exist")
-    return path
+# Per-field accessors for `show --field`: only the requested fields cross
+# the FFI boundary, instead of building the full dict and discarding most
+# of it. Keys match the keys of WheelEditor.as_dict().
+_FIELD_GETTERS = {
+    "name": lambda e: e.name,
+    "version": lambda e: e.version,
+    "summary": lambda e: e.summary,
+    "author": lambda e: e.author,
+    "author_email": lambda e: e.author_email,
+    "license": lambda e: e.license,
+    "requires_python": lambda e: e.requires_python,
+    "classifiers": lambda e: e.classifiers,
+    "requires_dist": lambda e: e.requires_dist,
+    "project_urls": lambda e: e.project_urls,
+    "python_tag": lambda e: e.python_tag,
+    "abi_tag": lambda e: e.abi_tag,
+    "platform_tag": lambda e: e.platform_tag,
+    "dist_info_dir": lambda e: e.dist_info_dir,
+}
 
 
 def _show(args: argparse.Namespace) -> None:
@@ -38,30 +57,14 @@ def _show(args: argparse.Namespace) -> None:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Build metadata dict
-    metadata = {
-        "name": editor.name,
-        "version": editor.version,
-        "summary": editor.summary,
-        "author": editor.author,
-        "author_email": editor.author_email,
-        "license": editor.license,
-        "requires_python": editor.requires_python,
-        "classifiers": editor.classifiers,
-        "requires_dist": editor.requires_dist,
-        "project_urls": editor.project_urls,
-        "python_tag": editor.python_tag,
-        "abi_tag": editor.abi_tag,
-        "platform_tag": editor.platform_tag,
-        "dist_info_dir": editor.dist_info_dir,
-    }
-
-    # Filter to specific fields if requested
     if args.field:
-        # Normalize field names (allow both underscore and hyphen)
+        # Normalize field names (allow both underscore and hyphen) and
+        # fetch only the requested fields from Rust
         normalized_fields = {f.replace("-", "_").lower() for f in args.field}
         metadata = {
-            k: v for k, v in metadata.items() if k.lower() in normalized_fields
+            f: getter(editor)
+            for f, getter in _FIELD_GETTERS.items()
+            if f in normalized_fields
         }
         if not metadata:
             print(
@@ -69,21 +72,32 @@ def _show(args: argparse.Namespace) -> None:
                 file=sys.stderr,
             )
             sys.exit(1)
+    else:
+        # Build the full metadata dict in a single FFI call
+        metadata = editor.as_dict()
 
     if args.as_json:
-        print(json.dumps(metadata, indent=2))
+        # Pretty-print for a terminal; compact form (smaller and faster to
+        # encode) when piping to another tool
+        indent = 2 if sys.stdout.isatty() else None
+        separators = (",", ":") if indent is None else None
+        sys.stdout.write(json.dumps(metadata, indent=indent, separators=separators))
+        sys.stdout.write("\n")
     else:
-        # Human-readable output
+        # Human-readable output, buffered into a single write so a wheel
+        # with dozens of classifiers doesn't issue a print per line
+        out = []
         for key, value in metadata.items():
             if value is None:
                 continue
             if isinstance(value, list):
                 if value:
-                    print(f"{key}:")
-                    for item in value:
-                        print(f"  - {item}")
+                    out.append(f"{key}:")
+                    out.extend(f"  - {item}" for item in value)
             else:
-                print(f"{key}: {value}")
+                out.append(f"{key}: {value}")
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
 
 
 def _edit(args: argparse.Namespace) -> None:
@@ -98,57 +112,37 @@ def _edit(args: argparse.Namespace) -> None:
 
     changes_made = False
 
-    # Apply single-value field changes
-    if args.pkg_name is not None:
-        editor.name = args.pkg_name
-        changes_made = True
-
-    if args.version is not None:
-        editor.version = args.version
-        changes_made = True
-
-    if args.summary is not None:
-        editor.summary = args.summary
-        changes_made = True
-
-    if args.author is not None:
-        editor.author = args.author
-        changes_made = True
-
-    if args.author_email is not None:
-        editor.author_email = args.author_email
-        changes_made = True
-
-    if args.pkg_license is not None:
-        editor.license = args.pkg_license
-        changes_made = True
-
-    if args.requires_python is not None:
-        editor.requires_python = args.requires_python
+    # Apply single-value field changes as one batch (one FFI call)
+    changes = {}
+    for field, value in (
+        ("name", args.pkg_name),
+        ("version", args.version),
+        ("summary", args.summary),
+        ("author", args.author),
+        ("author_email", args.author_email),
+        ("license", args.pkg_license),
+        ("requires_python", args.requires_python),
+    ):
+        if value is not None:
+            changes[field] = value
+    if changes:
+        editor.apply(changes)
         changes_made = True
 
     # Handle classifiers
     if args.set_classifiers is not None:
-        editor.classifiers = [
-            c.strip() for c in args.set_classifiers.split(",") if c.strip()
-        ]
+        editor.set_classifiers_csv(args.set_classifiers)
         changes_made = True
     elif args.add_classifier:
-        classifiers = list(editor.classifiers)
-        classifiers.extend(args.add_classifier)
-        editor.classifiers = classifiers
+        editor.extend_classifiers(args.add_classifier)
         changes_made = True
 
     # Handle requires_dist
     if args.set_requires_dist is not None:
-        editor.requires_dist = [
-            d.strip() for d in args.set_requires_dist.split(",") if d.strip()
-        ]
+        editor.set_requires_dist_csv(args.set_requires_dist)
         changes_made = True
     elif args.add_requires_dist:
-        deps = list(editor.requires_dist)
-        deps.extend(args.add_requires_dist)
-        editor.requires_dist = deps
+        editor.extend_requires_dist(args.add_requires_dist)
         changes_made = True
 
     # Handle RPATH modifications
@@ -268,8 +262,45 @@ def _validate(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def _build_parser() -> argparse.ArgumentParser:
+def _parse_show_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse a plain `show` invocation without importing argparse.
+
+    Returns a namespace compatible with what argparse would produce, or
+    None when the arguments need the full parser (unknown flags, help
+    requests, extra positionals, ...).
+    """
+    if not argv or argv[0] != "show":
+        return None
+
+    wheel = None
+    fields: List[str] = []
+    as_json = False
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token in ("--field", "-f"):
+            field = next(tokens, None)
+            if field is None:
+                return None
+            fields.append(field)
+        elif token == "--json":
+            as_json = True
+        elif token.startswith("-"):
+            # Unknown flag (including --help): defer to the full parser
+            return None
+        elif wheel is None:
+            wheel = token
+        else:
+            return None
+
+    if wheel is None:
+        return None
+    return SimpleNamespace(command="show", wheel=wheel, field=fields, as_json=as_json)
+
+
+def _build_parser() -> "argparse.ArgumentParser":
     """Build and return the argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="editwheel",
         description=(
@@ -292,7 +323,7 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Display wheel metadata",
         description="Display wheel metadata.",
     )
-    show_parser.add_argument("wheel", type=_existing_path, help="Path to a .whl file to inspect")
+    show_parser.add_argument("wheel", help="Path to a .whl file to inspect")
     show_parser.add_argument(
         "--json", dest="as_json", action="store_true", help="Output as JSON"
     )
@@ -309,7 +340,7 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Edit wheel metadata fields and save",
         description="Edit wheel metadata fields and save.",
     )
-    edit_parser.add_argument("wheel", type=_existing_path, help="Path to a .whl file to edit")
+    edit_parser.add_argument("wheel", help="Path to a .whl file to edit")
     edit_parser.add_argument(
         "--output",
         "-o",
@@ -406,7 +437,7 @@ def _build_parser() -> argparse.ArgumentParser:
         ),
     )
     validate_parser.add_argument(
-        "wheel", type=_existing_path, help="Path to a .whl file to validate"
+        "wheel", help="Path to a .whl file to validate"
     )
     validate_parser.add_argument(
         "--json", dest="as_json", action="store_true", help="Output as JSON"
@@ -421,8 +452,17 @@ def cli(args: Optional[List[str]] = None) -> None:
     Args:
         args: Command-line arguments. If None, uses sys.argv.
     """
-    parser = _build_parser()
-    parsed = parser.parse_args(args)
+    argv = sys.argv[1:] if args is None else args
+
+    # `--version` needs none of the parser machinery
+    if argv == ["--version"]:
+        print(f"editwheel {__version__}")
+        return
+
+    # Fast path for `show`, the most commonly scripted subcommand
+    parsed = _parse_show_fast(argv)
+    if parsed is None:
+        parsed = _build_parser().parse_args(argv)
 
     if parsed.command == "show":
         _show(parsed)
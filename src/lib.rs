@@ -33,10 +33,17 @@ mod python;
 use std::collections::HashMap;
 use std::collections::HashSet;
 use std::fs::File;
+use std::fs::OpenOptions;
 use std::io::BufReader;
+use std::io::BufWriter;
 use std::io::Read;
+use std::io::Seek;
+use std::io::Write;
 use std::path::Path;
 use std::path::PathBuf;
+use std::sync::OnceLock;
+
+use rayon::prelude::*;
 
 pub use elf::ElfInfo;
 pub use elf::ElfModification;
@@ -73,6 +80,15 @@ fn dedup_join<'a>(iter: impl Iterator<Item = &'a str>) -> String {
     parts.join(".")
 }
 
+/// Split a comma-separated option value, trimming items and dropping empties.
+fn split_csv(s: &str) -> Vec<String> {
+    s.split(',')
+        .map(str::trim)
+        .filter(|item| !item.is_empty())
+        .map(str::to_string)
+        .collect()
+}
+
 /// High-level API for editing Python wheel files
 ///
 /// This struct provides a convenient interface for reading, modifying,
@@ -80,7 +96,10 @@ fn dedup_join<'a>(iter: impl Iterator<Item = &'a str>) -> String {
 pub struct WheelEditor {
     path: PathBuf,
     metadata: Metadata,
-    record: Record,
+    /// Parsed RECORD, read lazily on first use. RECORD is O(number of files)
+    /// and only needed by `save`/`validate`, so metadata-only workloads
+    /// (e.g. `editwheel show`) never pay for parsing it.
+    record: OnceLock<Record>,
     dist_info_prefix: String,
     wheel_info: WheelInfo,
     /// Files that have been modified (path -> new content)
@@ -103,14 +122,13 @@ impl WheelEditor {
         let mut wheel_reader = WheelReader::new(reader)?;
 
         let metadata = wheel_reader.read_metadata()?;
-        let record = wheel_reader.read_record()?;
         let wheel_info = wheel_reader.read_wheel_info()?;
         let dist_info_prefix = wheel_reader.dist_info_prefix().to_string();
 
         Ok(Self {
             path,
             metadata,
-            record,
+            record: OnceLock::new(),
             dist_info_prefix,
             wheel_info,
             modified_files: HashMap::new(),
@@ -124,6 +142,18 @@ impl WheelEditor {
         &self.path
     }
 
+    /// Get the parsed RECORD, reading it from the archive on first access.
+    fn record(&self) -> Result<&Record, WheelError> {
+        if self.record.get().is_none() {
+            let file = File::open(&self.path)?;
+            let reader = BufReader::new(file);
+            let mut wheel_reader = WheelReader::new(reader)?;
+            let record = wheel_reader.read_record()?;
+            let _ = self.record.set(record);
+        }
+        Ok(self.record.get().expect("record initialized above"))
+    }
+
     /// Get the dist-info directory name as it would appear in the saved wheel.
     ///
     /// This reflects the **current** metadata, so if `set_name` or
@@ -260,11 +290,21 @@ impl WheelEditor {
         self.metadata.classifiers = classifiers;
     }
 
+    /// Set the package classifiers from a comma-separated string
+    pub fn set_classifiers_csv(&mut self, classifiers: &str) {
+        self.metadata.classifiers = split_csv(classifiers);
+    }
+
     /// Add a classifier
     pub fn add_classifier(&mut self, classifier: impl Into<String>) {
         self.metadata.classifiers.push(classifier.into());
     }
 
+    /// Add multiple classifiers
+    pub fn extend_classifiers(&mut self, classifiers: impl IntoIterator<Item = String>) {
+        self.metadata.classifiers.extend(classifiers);
+    }
+
     /// Get the package dependencies
     pub fn requires_dist(&self) -> &[String] {
         &self.metadata.requires_dist
@@ -275,11 +315,21 @@ impl WheelEditor {
         self.metadata.requires_dist = deps;
     }
 
+    /// Set the package dependencies from a comma-separated string
+    pub fn set_requires_dist_csv(&mut self, deps: &str) {
+        self.metadata.requires_dist = split_csv(deps);
+    }
+
     /// Add a dependency
     pub fn add_requires_dist(&mut self, dep: impl Into<String>) {
         self.metadata.requires_dist.push(dep.into());
     }
 
+    /// Add multiple dependencies
+    pub fn extend_requires_dist(&mut self, deps: impl IntoIterator<Item = String>) {
+        self.metadata.requires_dist.extend(deps);
+    }
+
     /// Get the project URLs
     pub fn project_urls(&self) -> &[String] {
         &self.metadata.project_url
@@ -391,33 +441,39 @@ impl WheelEditor {
         let reader = BufReader::new(file);
         let mut archive = zip::ZipArchive::new(reader)?;
 
-        // Find all files matching the pattern
-        let mut matching_files = Vec::new();
+        // Read the contents of matching ELF files. Zip decompression is
+        // sequential, so the IO pass stays single-threaded.
+        let mut elf_files: Vec<(String, Vec<u8>)> = Vec::new();
         for i in 0..archive.len() {
-            let entry = archive.by_index(i)?;
-            let name = entry.name().to_string();
-            if glob_pattern.matches(&name) {
-                matching_files.push(name);
+            let name = archive.by_index_raw(i)?.name().to_string();
+            if !glob_pattern.matches(&name) {
+                continue;
             }
-        }
 
-        // Modify each matching file
-        let mut modified_count = 0;
-        for file_path in matching_files {
-            // Read the file content
-            let mut entry = archive.by_name(&file_path)?;
+            let mut entry = archive.by_name(&name)?;
             let mut content = Vec::new();
             entry.read_to_end(&mut content)?;
-            drop(entry); // Release borrow
 
             // Check if it's an ELF file (magic bytes: 0x7F 'E' 'L' 'F')
             if content.len() < 4 || &content[0..4] != b"\x7FELF" {
                 continue; // Skip non-ELF files
             }
+            elf_files.push((name, content));
+        }
 
-            // Modify the ELF file - use RUNPATH (preferred over RPATH)
-            let modifications = vec![ElfModification::SetRunpath(rpath.to_string())];
-            match elf::modify_elf(&content, &modifications) {
+        // Patch the ELF files in parallel - use RUNPATH (preferred over RPATH)
+        let modifications = vec![ElfModification::SetRunpath(rpath.to_string())];
+        let results: Vec<(String, Result<Vec<u8>, ElfError>)> = elf_files
+            .into_par_iter()
+            .map(|(path, content)| {
+                let modified = elf::modify_elf(&content, &modifications);
+                (path, modified)
+            })
+            .collect();
+
+        let mut modified_count = 0;
+        for (file_path, result) in results {
+            match result {
                 Ok(modified_content) => {
                     self.modified_files.insert(file_path, modified_content);
                     modified_count += 1;
@@ -450,7 +506,7 @@ impl WheelEditor {
         let file = File::open(&self.path)?;
         let reader = BufReader::new(file);
         let mut archive = zip::ZipArchive::new(reader)?;
-        validate_wheel(&mut archive, &self.record)
+        validate_wheel(&mut archive, self.record()?)
     }
 
     /// Save the modified wheel to a new file
@@ -464,43 +520,74 @@ impl WheelEditor {
         // Compute new dist-info prefix if name or version changed
         let new_dist_info = dist_info_name(&self.metadata.name, &self.metadata.version);
 
+        let record = self.record()?;
+
         // Open source for reading
         let source_file = File::open(&self.path)?;
         let source_reader = BufReader::new(source_file);
         let mut source_archive = zip::ZipArchive::new(source_reader)?;
 
         // Create output file
-        let output_file = File::create(output_path)?;
+        let mut output_file = OpenOptions::new()
+            .write(true)
+            .create(true)
+            .truncate(true)
+            .open(output_path)?;
+
+        // Most saves produce a wheel close to the source size (unchanged
+        // entries are copied as-is), so preallocate that much up front to
+        // avoid per-extent allocation during the write. Best-effort only;
+        // any over-allocation is trimmed by the set_len below.
+        #[cfg(target_os = "linux")]
+        if let Ok(metadata) = std::fs::metadata(&self.path) {
+            use std::os::unix::io::AsRawFd;
+            if metadata.len() > 0 {
+                unsafe {
+                    libc::posix_fallocate(output_file.as_raw_fd(), 0, metadata.len() as i64);
+                }
+            }
+        }
 
-        // Use extended writer if we have modified files, added files, or
-        // wheel info changes.
-        if !self.modified_files.is_empty()
-            || !self.added_files.is_empty()
-            || self.wheel_info_modified
         {
-            write_modified_extended(
-                &mut source_archive,
-                output_file,
-                &self.metadata,
-                &self.record,
-                &self.dist_info_prefix,
-                &new_dist_info,
-                &self.modified_files,
-                &self.added_files,
-                Some(&self.wheel_info),
-            )?;
-        } else {
-            // Use the original writer for backward compatibility
-            write_modified(
-                &mut source_archive,
-                output_file,
-                &self.metadata,
-                &self.record,
-                &self.dist_info_prefix,
-                &new_dist_info,
-            )?;
+            let mut writer = BufWriter::with_capacity(1 << 20, &mut output_file);
+
+            // Use extended writer if we have modified files, added files, or
+            // wheel info changes.
+            if !self.modified_files.is_empty()
+                || !self.added_files.is_empty()
+                || self.wheel_info_modified
+            {
+                write_modified_extended(
+                    &mut source_archive,
+                    &mut writer,
+                    &self.metadata,
+                    record,
+                    &self.dist_info_prefix,
+                    &new_dist_info,
+                    &self.modified_files,
+                    &self.added_files,
+                    Some(&self.wheel_info),
+                )?;
+            } else {
+                // Use the original writer for backward compatibility
+                write_modified(
+                    &mut source_archive,
+                    &mut writer,
+                    &self.metadata,
+                    record,
+                    &self.dist_info_prefix,
+                    &new_dist_info,
+                )?;
+            }
+
+            writer.flush()?;
         }
 
+        // Trim preallocated slack — trailing bytes after the end-of-central-
+        // directory record would confuse readers that scan from the file end.
+        let end = output_file.stream_position()?;
+        output_file.set_len(end)?;
+
         Ok(())
     }
 }
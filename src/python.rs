@@ -6,7 +6,11 @@ use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyAny;
 use pyo3::types::PyBytes;
+use pyo3::types::PyDict;
 use pyo3::types::PyList;
+use pyo3::types::PyString;
+
+use std::sync::OnceLock;
 
 use crate::ValidationError;
 use crate::ValidationResult;
@@ -113,6 +117,20 @@ impl From<WheelError> for PyErr {
 #[pyclass(name = "WheelEditor")]
 pub struct PyWheelEditor {
     inner: WheelEditor,
+    /// Cached Python strings for the hot `name`/`version` getters, so
+    /// repeated reads are a refcount bump instead of a fresh `PyString`
+    /// allocation. Reset by the corresponding setters.
+    name_cache: OnceLock<Py<PyString>>,
+    version_cache: OnceLock<Py<PyString>>,
+}
+
+impl PyWheelEditor {
+    /// Drop cached name/version strings after a metadata write that may
+    /// have changed either field.
+    fn clear_string_caches(&mut self) {
+        self.name_cache = OnceLock::new();
+        self.version_cache = OnceLock::new();
+    }
 }
 
 #[pymethods]
@@ -133,30 +151,40 @@ impl PyWheelEditor {
         }
 
         let editor = WheelEditor::open(wheel_path)?;
-        Ok(Self { inner: editor })
+        Ok(Self {
+            inner: editor,
+            name_cache: OnceLock::new(),
+            version_cache: OnceLock::new(),
+        })
     }
 
     /// Get the package name
     #[getter]
-    fn name(&self) -> &str {
-        self.inner.name()
+    fn name(&self, py: Python<'_>) -> Py<PyString> {
+        self.name_cache
+            .get_or_init(|| PyString::new(py, self.inner.name()).unbind())
+            .clone_ref(py)
     }
 
     /// Set the package name
     #[setter]
     fn set_name(&mut self, name: String) {
+        self.name_cache = OnceLock::new();
         self.inner.set_name(name);
     }
 
     /// Get the package version
     #[getter]
-    fn version(&self) -> &str {
-        self.inner.version()
+    fn version(&self, py: Python<'_>) -> Py<PyString> {
+        self.version_cache
+            .get_or_init(|| PyString::new(py, self.inner.version()).unbind())
+            .clone_ref(py)
     }
 
     /// Set the package version
     #[setter]
     fn set_version(&mut self, version: String) {
+        self.version_cache = OnceLock::new();
         self.inner.set_version(version);
     }
 
@@ -232,7 +260,11 @@ impl PyWheelEditor {
         self.inner.set_requires_python(version);
     }
 
-    /// Get the package classifiers
+    /// Get the package classifiers.
+    ///
+    /// Returns a fresh list on every access; mutating it does not affect
+    /// the editor unless it is assigned back (or `extend_classifiers` is
+    /// used, which skips the round-trip).
     #[getter]
     fn classifiers(&self) -> Vec<String> {
         self.inner.classifiers().to_vec()
@@ -244,7 +276,11 @@ impl PyWheelEditor {
         self.inner.set_classifiers(classifiers);
     }
 
-    /// Get the package dependencies (Requires-Dist)
+    /// Get the package dependencies (Requires-Dist).
+    ///
+    /// Returns a fresh list on every access; mutating it does not affect
+    /// the editor unless it is assigned back (or `extend_requires_dist` is
+    /// used, which skips the round-trip).
     #[getter]
     fn requires_dist(&self) -> Vec<String> {
         self.inner.requires_dist().to_vec()
@@ -325,6 +361,36 @@ impl PyWheelEditor {
         self.inner.set_platform_tag(&platform);
     }
 
+    /// Build a dict of all displayable metadata in a single call.
+    ///
+    /// Equivalent to reading each getter individually, but crosses the
+    /// Python/Rust boundary once instead of once per field — callers that
+    /// need the full picture (like `editwheel show`) should prefer this.
+    ///
+    /// Returns:
+    ///     Dict with the same keys and values as the individual getters:
+    ///     name, version, summary, author, author_email, license,
+    ///     requires_python, classifiers, requires_dist, project_urls,
+    ///     python_tag, abi_tag, platform_tag, dist_info_dir.
+    fn as_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        dict.set_item("name", self.inner.name())?;
+        dict.set_item("version", self.inner.version())?;
+        dict.set_item("summary", self.inner.summary())?;
+        dict.set_item("author", self.inner.author())?;
+        dict.set_item("author_email", self.inner.author_email())?;
+        dict.set_item("license", self.inner.license())?;
+        dict.set_item("requires_python", self.inner.requires_python())?;
+        dict.set_item("classifiers", self.inner.classifiers().to_vec())?;
+        dict.set_item("requires_dist", self.inner.requires_dist().to_vec())?;
+        dict.set_item("project_urls", self.inner.project_urls().to_vec())?;
+        dict.set_item("python_tag", self.inner.python_tag())?;
+        dict.set_item("abi_tag", self.inner.abi_tag())?;
+        dict.set_item("platform_tag", self.inner.platform_tag())?;
+        dict.set_item("dist_info_dir", self.inner.dist_info_dir())?;
+        Ok(dict)
+    }
+
     /// Get the RPATH of a specific file in the wheel.
     ///
     /// Returns the effective RPATH (prefers RUNPATH over RPATH).
@@ -356,8 +422,10 @@ impl PyWheelEditor {
     /// Example:
     ///     >>> editor.set_rpath("torch/lib/*.so", "$ORIGIN:$ORIGIN/../../nccl_lib/lib")
     ///     15
-    fn set_rpath(&mut self, pattern: &str, rpath: &str) -> PyResult<usize> {
-        Ok(self.inner.set_rpath(pattern, rpath)?)
+    fn set_rpath(&mut self, py: Python<'_>, pattern: &str, rpath: &str) -> PyResult<usize> {
+        // The glob/read/patch work is pure Rust; release the GIL so the
+        // Rayon workers patching individual ELFs are never blocked on it.
+        Ok(py.allow_threads(|| self.inner.set_rpath(pattern, rpath))?)
     }
 
     /// Add a dependency (Requires-Dist) to the wheel.
@@ -370,6 +438,45 @@ impl PyWheelEditor {
         self.inner.add_requires_dist(dep);
     }
 
+    /// Replace all classifiers from a comma-separated string.
+    ///
+    /// Values are trimmed and empty items dropped; the splitting happens on
+    /// the Rust side so no intermediate Python list is built.
+    ///
+    /// Args:
+    ///     classifiers: Comma-separated classifier string
+    fn set_classifiers_csv(&mut self, classifiers: &str) {
+        self.inner.set_classifiers_csv(classifiers);
+    }
+
+    /// Replace all dependencies (Requires-Dist) from a comma-separated string.
+    ///
+    /// Args:
+    ///     deps: Comma-separated dependency string
+    fn set_requires_dist_csv(&mut self, deps: &str) {
+        self.inner.set_requires_dist_csv(deps);
+    }
+
+    /// Add several classifiers in one call.
+    ///
+    /// Appends directly to the Rust-side list, avoiding the
+    /// getter/extend/setter round-trip (which clones the full list across
+    /// the FFI boundary twice).
+    ///
+    /// Args:
+    ///     items: Classifier strings to append
+    fn extend_classifiers(&mut self, items: Vec<String>) {
+        self.inner.extend_classifiers(items);
+    }
+
+    /// Add several dependencies (Requires-Dist) in one call.
+    ///
+    /// Args:
+    ///     items: Dependency specifications to append
+    fn extend_requires_dist(&mut self, items: Vec<String>) {
+        self.inner.extend_requires_dist(items);
+    }
+
     /// Get the dist-info directory name as it would appear in the saved wheel.
     ///
     /// Reflects the *current* metadata, so this is safe to use for
@@ -554,6 +661,53 @@ impl PyWheelEditor {
             }
         }
 
+        if matches!(key, "Name" | "Version") {
+            self.clear_string_caches();
+        }
+
+        Ok(())
+    }
+
+    /// Apply several single-value metadata changes in one call.
+    ///
+    /// Equivalent to assigning each property individually, but crosses the
+    /// Python/Rust boundary once for the whole batch.
+    ///
+    /// Args:
+    ///     changes: Dict mapping field names to string values. Supported
+    ///              keys mirror the writable string properties: name,
+    ///              version, summary, description, author, author_email,
+    ///              license, requires_python.
+    ///
+    /// Raises:
+    ///     ValueError: If a key is not a recognized field (no changes from
+    ///                 the failing batch are rolled back)
+    fn apply(&mut self, changes: &Bound<'_, PyDict>) -> PyResult<()> {
+        for (key, value) in changes.iter() {
+            let key: String = key.extract()?;
+            let value: String = value.extract()?;
+            match key.as_str() {
+                "name" => {
+                    self.name_cache = OnceLock::new();
+                    self.inner.set_name(value)
+                }
+                "version" => {
+                    self.version_cache = OnceLock::new();
+                    self.inner.set_version(value)
+                }
+                "summary" => self.inner.set_summary(value),
+                "description" => self.inner.set_description(value),
+                "author" => self.inner.set_author(value),
+                "author_email" => self.inner.set_author_email(value),
+                "license" => self.inner.set_license(value),
+                "requires_python" => self.inner.set_requires_python(value),
+                _ => {
+                    return Err(PyValueError::new_err(format!(
+                        "unknown field for apply(): '{key}'"
+                    )));
+                }
+            }
+        }
         Ok(())
     }
 
@@ -566,19 +720,25 @@ impl PyWheelEditor {
     /// Raises:
     ///     IOError: If the wheel cannot be saved
     #[pyo3(signature = (output_path = None))]
-    fn save(&self, output_path: Option<&str>) -> PyResult<()> {
+    fn save(&self, py: Python<'_>, output_path: Option<&str>) -> PyResult<()> {
+        // All save state lives in Rust structs, so the long-running
+        // copy/IO work can run with the GIL released — other Python
+        // threads (and signal handlers) keep running, and a pool-based
+        // caller can overlap saves across wheels.
         match output_path {
             Some(path) => {
-                self.inner.save(path)?;
+                py.allow_threads(|| self.inner.save(path))?;
                 Ok(())
             }
             None => {
                 // Save to a temp file, then overwrite original
-                // Get the original path from the inner editor
                 let original_path = self.get_wheel_path();
                 let temp_path = format!("{}.tmp", original_path);
-                self.inner.save(&temp_path)?;
-                std::fs::rename(&temp_path, &original_path)?;
+                py.allow_threads(|| -> Result<(), WheelError> {
+                    self.inner.save(&temp_path)?;
+                    std::fs::rename(&temp_path, &original_path)?;
+                    Ok(())
+                })?;
                 Ok(())
             }
         }
@@ -10,7 +10,7 @@ use crate::error::ValidationError;
 use crate::error::ValidationResult;
 use crate::error::WheelError;
 use crate::record::Record;
-use crate::record::hash_content;
+use crate::record::hash_reader;
 
 /// Validate all file hashes in a wheel against the RECORD file
 pub fn validate_wheel<R: Read + Seek>(
@@ -44,12 +44,10 @@ pub fn validate_wheel<R: Read + Seek>(
             continue;
         }
 
-        // Read file contents and compute hash
-        let mut file = archive.by_name(&entry.path)?;
-        let mut contents = Vec::new();
-        file.read_to_end(&mut contents)?;
-
-        let actual_hash = hash_content(&contents);
+        // Stream the file contents through the hasher without buffering
+        // the whole entry in memory
+        let file = archive.by_name(&entry.path)?;
+        let actual_hash = hash_reader(file)?;
         let expected_hash = entry.hash.as_ref().unwrap();
 
         if &actual_hash != expected_hash {
@@ -85,6 +83,7 @@ mod tests {
 
     use super::*;
     use crate::record::RecordEntry;
+    use crate::record::hash_content;
 
     fn create_valid_wheel() -> (Vec<u8>, Record) {
         let mut buf = Cursor::new(Vec::new());
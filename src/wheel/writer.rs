@@ -7,6 +7,7 @@ use std::io::Read;
 use std::io::Seek;
 use std::io::Write;
 
+use rayon::prelude::*;
 use zip::ZipArchive;
 use zip::ZipWriter;
 use zip::write::SimpleFileOptions;
@@ -204,6 +205,9 @@ pub fn write_modified_extended<R: Read + Seek, W: Write + Seek>(
 
     // Build the final paths for added files up-front so we can detect
     // collisions with files in the source archive before writing anything.
+    // The per-entry collision scan only runs when files were actually
+    // added; saves with only modified content skip the extra directory
+    // pass entirely.
     let mut added_final: HashMap<String, &Vec<u8>> = HashMap::new();
     for (path, content) in added_files {
         let final_path = rename_path(path);
@@ -218,18 +222,34 @@ pub fn write_modified_extended<R: Read + Seek, W: Write + Seek>(
         }
         added_final.insert(final_path, content);
     }
-    for i in 0..source.len() {
-        let name = source.by_index_raw(i)?.name().to_string();
-        let final_name = rename_path(&name);
-        if added_final.contains_key(&final_name) {
-            return Err(WheelError::InvalidWheel(format!(
-                "add_file path '{}' collides with an existing file in the source archive",
-                final_name
-            )));
+    if !added_final.is_empty() {
+        for i in 0..source.len() {
+            let name = source.by_index_raw(i)?.name().to_string();
+            let final_name = rename_path(&name);
+            if added_final.contains_key(&final_name) {
+                return Err(WheelError::InvalidWheel(format!(
+                    "add_file path '{}' collides with an existing file in the source archive",
+                    final_name
+                )));
+            }
         }
     }
 
-    // Phase 1: Copy all files, handling modifications
+    // Digest rewritten content up front, in parallel. Unchanged entries
+    // reuse their RECORD lines, so these are the only hashes computed per
+    // save; sha2 dispatches to SHA-NI at runtime where available.
+    let modified_hashes: HashMap<&str, String> = modified_files
+        .par_iter()
+        .map(|(path, content)| (path.as_str(), hash_content(content)))
+        .collect();
+    let added_hashes: HashMap<&str, String> = added_final
+        .par_iter()
+        .map(|(path, content)| (path.as_str(), hash_content(content)))
+        .collect();
+
+    // Phase 1: Copy all files, handling modifications. Unchanged entries
+    // are appended as raw compressed bytes — no recompression, and their
+    // existing CRC32/hash travel with them.
     for i in 0..source.len() {
         let entry = source.by_index_raw(i)?;
         let name = entry.name().to_string();
@@ -245,13 +265,7 @@ pub fn write_modified_extended<R: Read + Seek, W: Write + Seek>(
         }
 
         // Determine the new path (handle dist-info and .data rename for version changes)
-        let new_name = if needs_rename && name.starts_with(old_dist_info) {
-            name.replacen(old_dist_info, new_dist_info, 1)
-        } else if needs_rename && name.starts_with(&old_data_dir) {
-            name.replacen(&old_data_dir, &new_data_dir, 1)
-        } else {
-            name.clone()
-        };
+        let new_name = rename_path(&name);
 
         // Check if this file has been modified
         if let Some(modified_content) = modified_files.get(&name) {
@@ -266,8 +280,10 @@ pub fn write_modified_extended<R: Read + Seek, W: Write + Seek>(
             writer.start_file(&new_name, file_options)?;
             writer.write_all(modified_content)?;
 
-            // Compute new hash for modified content
-            let hash = hash_content(modified_content);
+            let hash = modified_hashes
+                .get(name.as_str())
+                .cloned()
+                .expect("all modified files were hashed above");
             new_record_entries.push(RecordEntry::new(
                 new_name,
                 Some(hash),
@@ -358,7 +374,10 @@ pub fn write_modified_extended<R: Read + Seek, W: Write + Seek>(
         writer.start_file(final_path, file_options)?;
         writer.write_all(content)?;
 
-        let hash = hash_content(content);
+        let hash = added_hashes
+            .get(final_path.as_str())
+            .cloned()
+            .expect("all added files were hashed above");
         new_record_entries.push(RecordEntry::new(
             final_path.clone(),
             Some(hash),
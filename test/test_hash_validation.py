@@ -4,73 +4,155 @@
 """Test script to verify RECORD file hash validation in editwheel-rs."""
 
 import base64
-import csv
 import hashlib
-import io
+import mmap
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from editwheel import WheelEditor
 
-
-def create_test_wheel_with_valid_hashes(temp_dir: Path) -> Path:
-    """Create a test wheel with valid hashes in RECORD."""
-    wheel_path = temp_dir / "test_package-1.0.0-py3-none-any.whl"
-
-    # Create wheel content
-    files_to_add = {}
-
-    # Package files
-    files_to_add["test_package/__init__.py"] = (
-        b"# Test package\n__version__ = '1.0.0'\n"
-    )
-    files_to_add["test_package/module.py"] = (
-        b"def hello():\n    return 'Hello, World!'\n"
-    )
-
-    # Dist-info files
-    metadata_content = b"""Metadata-Version: 2.1
+# `usedforsecurity=False` lets OpenSSL pick its fastest SHA-256
+# implementation (SHA-NI where the CPU has it); copying a prototype
+# hasher skips the per-call EVP context setup.
+try:
+    _SHA256_PROTO = hashlib.new("sha256", usedforsecurity=False)
+except (TypeError, ValueError):
+    _SHA256_PROTO = hashlib.new("sha256")
+
+
+def _sha256(data: bytes = b""):
+    """Return a SHA-256 hasher primed with `data`."""
+    hasher = _SHA256_PROTO.copy()
+    if data:
+        hasher.update(data)
+    return hasher
+
+
+# Reusable scratch buffer for streaming zip entries through the hasher
+# without materializing each decompressed file as a fresh bytes object.
+_HASH_BUF = bytearray(1 << 20)
+_HASH_VIEW = memoryview(_HASH_BUF)
+
+
+def _hash_and_size_entry(entry) -> "tuple[str, int]":
+    """Stream a file-like object through SHA-256 in fixed-size chunks.
+
+    Returns the RECORD-style urlsafe-base64 digest (padding stripped)
+    and the total decompressed size.
+    """
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: the readinto loop runs in C with the GIL released;
+        # tell() on the drained entry gives the decompressed size
+        digest = hashlib.file_digest(entry, _sha256).digest()
+        return _b64_sha256(digest), entry.tell()
+
+    hasher = _sha256()
+    total = 0
+    while n := entry.readinto(_HASH_BUF):
+        hasher.update(_HASH_VIEW[:n])
+        total += n
+    return _b64_sha256(hasher.digest()), total
+
+
+def _b64_sha256(digest: bytes) -> str:
+    """RECORD-style base64url of a SHA-256 digest.
+
+    A 32-byte digest always encodes to 43 characters plus exactly one
+    '=' pad, so a fixed slice replaces the rstrip scan.
+    """
+    return base64.urlsafe_b64encode(digest)[:43].decode("ascii")
+
+
+def _hash_entry(item: "tuple[str, bytes]") -> list:
+    """Map a (path, content) pair to its RECORD row."""
+    path, content = item
+    return [path, f"sha256={_b64_sha256(_sha256(content).digest())}", str(len(content))]
+
+
+def _record_bytes(entries: list) -> bytes:
+    """Serialize RECORD rows (path, hash, size) without csv machinery.
+
+    None of the fixture paths need quoting, so a plain join matches
+    csv.writer's output byte for byte at a fraction of the cost.
+    """
+    return b"".join(f"{p},{h},{s}\r\n".encode("utf-8") for p, h, s in entries)
+
+
+# Fixture wheel contents as (path, bytes) pairs: one ordered sequence
+# drives both the hashing pass and the zip write. Module-level so the
+# bytes objects are built once, not per fixture call.
+#
+# Entries are listed in wheel-spec archive order — package files first,
+# then dist-info, with RECORD appended last by the builders — so the
+# written central directory matches what installers (and the Rust
+# reader) expect to stream in one pass.
+_VALID_FILES = (
+    ("test_package/__init__.py", b"# Test package\n__version__ = '1.0.0'\n"),
+    ("test_package/module.py", b"def hello():\n    return 'Hello, World!'\n"),
+    (
+        "test_package-1.0.0.dist-info/METADATA",
+        b"""Metadata-Version: 2.1
 Name: test-package
 Version: 1.0.0
 Summary: A test package
 Author: Test Author
 Author-email: test@example.com
-"""
-    files_to_add["test_package-1.0.0.dist-info/METADATA"] = metadata_content
-
-    wheel_content = b"""Wheel-Version: 1.0
+""",
+    ),
+    (
+        "test_package-1.0.0.dist-info/WHEEL",
+        b"""Wheel-Version: 1.0
 Generator: test-script
 Root-Is-Purelib: true
 Tag: py3-none-any
-"""
-    files_to_add["test_package-1.0.0.dist-info/WHEEL"] = wheel_content
-
-    # Create RECORD with correct hashes
-    record_entries = []
-    for path, content in files_to_add.items():
-        # Compute SHA256 hash
-        hasher = hashlib.sha256()
-        hasher.update(content)
-        hash_digest = (
-            base64.urlsafe_b64encode(hasher.digest()).decode("ascii").rstrip("=")
-        )
-        record_entries.append([path, f"sha256={hash_digest}", str(len(content))])
+""",
+    ),
+)
+
+_INVALID_FILES = (
+    ("bad_package/__init__.py", b"# Bad package\n__version__ = '1.0.0'\n"),
+    ("bad_package/module.py", b"def hello():\n    return 'Hello, World!'\n"),
+    (
+        "bad_package-1.0.0.dist-info/METADATA",
+        b"""Metadata-Version: 2.1
+Name: bad-package
+Version: 1.0.0
+Summary: A bad test package
+""",
+    ),
+    (
+        "bad_package-1.0.0.dist-info/WHEEL",
+        b"""Wheel-Version: 1.0
+Generator: test-script
+Root-Is-Purelib: true
+Tag: py3-none-any
+""",
+    ),
+)
+
+
+def create_test_wheel_with_valid_hashes(temp_dir: Path) -> Path:
+    """Create a test wheel with valid hashes in RECORD."""
+    wheel_path = temp_dir / "test_package-1.0.0-py3-none-any.whl"
+
+    files = list(_VALID_FILES)
+
+    # Create RECORD with correct hashes. hashlib releases the GIL for
+    # buffers above ~2 KiB, so per-file hashing parallelizes on threads.
+    with ThreadPoolExecutor() as ex:
+        record_entries = list(ex.map(_hash_entry, files))
 
     # RECORD file itself has empty hash/size
     record_entries.append(["test_package-1.0.0.dist-info/RECORD", "", ""])
 
-    # Create RECORD content
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerows(record_entries)
-    files_to_add["test_package-1.0.0.dist-info/RECORD"] = output.getvalue().encode(
-        "utf-8"
-    )
+    files.append(("test_package-1.0.0.dist-info/RECORD", _record_bytes(record_entries)))
 
     # Create wheel
-    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for path, content in files_to_add.items():
+    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_STORED) as zf:
+        for path, content in files:
             zf.writestr(path, content)
 
     return wheel_path
@@ -80,29 +162,7 @@ def create_test_wheel_with_invalid_hashes(temp_dir: Path) -> Path:
     """Create a test wheel with invalid hashes in RECORD."""
     wheel_path = temp_dir / "bad_package-1.0.0-py3-none-any.whl"
 
-    # Create wheel content
-    files_to_add = {}
-
-    # Package files
-    files_to_add["bad_package/__init__.py"] = b"# Bad package\n__version__ = '1.0.0'\n"
-    files_to_add["bad_package/module.py"] = (
-        b"def hello():\n    return 'Hello, World!'\n"
-    )
-
-    # Dist-info files
-    metadata_content = b"""Metadata-Version: 2.1
-Name: bad-package
-Version: 1.0.0
-Summary: A bad test package
-"""
-    files_to_add["bad_package-1.0.0.dist-info/METADATA"] = metadata_content
-
-    wheel_content = b"""Wheel-Version: 1.0
-Generator: test-script
-Root-Is-Purelib: true
-Tag: py3-none-any
-"""
-    files_to_add["bad_package-1.0.0.dist-info/WHEEL"] = wheel_content
+    files = list(_INVALID_FILES)
 
     # Create RECORD with INCORRECT hashes (using wrong hash values)
     record_entries = [
@@ -113,106 +173,128 @@ Tag: py3-none-any
         ["bad_package-1.0.0.dist-info/RECORD", "", ""],
     ]
 
-    # Create RECORD content
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerows(record_entries)
-    files_to_add["bad_package-1.0.0.dist-info/RECORD"] = output.getvalue().encode(
-        "utf-8"
-    )
+    files.append(("bad_package-1.0.0.dist-info/RECORD", _record_bytes(record_entries)))
 
     # Create wheel
-    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for path, content in files_to_add.items():
+    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_STORED) as zf:
+        for path, content in files:
             zf.writestr(path, content)
 
     return wheel_path
 
 
+@pytest.fixture(scope="session")
+def valid_wheel_master(tmp_path_factory) -> Path:
+    """The valid-hashes wheel, built once per session."""
+    return create_test_wheel_with_valid_hashes(
+        tmp_path_factory.mktemp("valid_whl_session")
+    )
+
+
+@pytest.fixture(scope="session")
+def invalid_wheel_master(tmp_path_factory) -> Path:
+    """The invalid-hashes wheel, built once per session."""
+    return create_test_wheel_with_invalid_hashes(
+        tmp_path_factory.mktemp("invalid_whl_session")
+    )
+
+
+@pytest.fixture
+def valid_wheel(valid_wheel_master: Path, tmp_path) -> Path:
+    """Per-test copy of the session wheel (cheap relative to rebuilding)."""
+    dst = tmp_path / valid_wheel_master.name
+    shutil.copy(valid_wheel_master, dst)
+    return dst
+
+
+@pytest.fixture
+def invalid_wheel(invalid_wheel_master: Path, tmp_path) -> Path:
+    """Per-test copy of the session wheel (cheap relative to rebuilding)."""
+    dst = tmp_path / invalid_wheel_master.name
+    shutil.copy(invalid_wheel_master, dst)
+    return dst
+
+
 class TestHashValidation:
     """Tests for hash validation in wheels."""
 
-    def test_valid_wheel_can_be_loaded(self, tmp_path):
+    def test_valid_wheel_can_be_loaded(self, valid_wheel):
         """Test that a wheel with valid hashes can be loaded."""
-        wheel_path = create_test_wheel_with_valid_hashes(tmp_path)
-
         # Should not raise any exception
-        editor = WheelEditor(str(wheel_path))
+        editor = WheelEditor(str(valid_wheel))
         assert editor.name == "test-package"
         assert editor.version == "1.0.0"
 
-    def test_invalid_hashes_wheel_can_still_be_loaded(self, tmp_path):
+    def test_invalid_hashes_wheel_can_still_be_loaded(self, invalid_wheel):
         """Test that a wheel with invalid hashes can still be loaded.
 
         Note: The Rust library loads wheels even with invalid hashes.
         Hash validation is done separately via the validate() method.
         """
-        wheel_path = create_test_wheel_with_invalid_hashes(tmp_path)
-
         # Should load successfully (validation is not done on load)
-        editor = WheelEditor(str(wheel_path))
+        editor = WheelEditor(str(invalid_wheel))
         assert editor.name == "bad-package"
         assert editor.version == "1.0.0"
 
-    def test_edited_wheel_has_valid_hashes(self, tmp_path):
+    def test_edited_wheel_has_valid_hashes(self, valid_wheel, tmp_path):
         """Test that an edited wheel has correct hashes."""
-        wheel_path = create_test_wheel_with_valid_hashes(tmp_path)
-
-        editor = WheelEditor(str(wheel_path))
+        editor = WheelEditor(str(valid_wheel))
         editor.summary = "Modified summary"
 
         output_path = tmp_path / "edited.whl"
         editor.save(str(output_path))
 
-        # Verify the saved wheel has valid hashes
-        with zipfile.ZipFile(output_path, "r") as zf:
-            # Find RECORD
-            record_path = None
-            for name in zf.namelist():
-                if name.endswith("/RECORD"):
-                    record_path = name
-                    break
+        # Verify the saved wheel has valid hashes. Map the file and hand
+        # the mapping to ZipFile directly (mmap is file-like), so the
+        # many small member reads hit the page cache instead of seeking
+        # through buffered file I/O.
+        with open(output_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm, zipfile.ZipFile(mm) as zf:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            # Find RECORD without materializing namelist()'s list copy
+            record_path = next(
+                (name for name in zf.NameToInfo if name.endswith("/RECORD")), None
+            )
 
             assert record_path is not None, "RECORD file should exist"
 
             with zf.open(record_path) as f:
                 record_content = f.read().decode("utf-8")
-                reader = csv.reader(io.StringIO(record_content))
-
-                for row in reader:
-                    if len(row) < 3:
-                        continue
-
-                    path, hash_str, size_str = row[0], row[1], row[2]
-
-                    # Skip RECORD itself
-                    if path.endswith("/RECORD"):
-                        assert hash_str == "", "RECORD should have empty hash"
-                        continue
-
-                    if not hash_str:
-                        continue
-
-                    # Verify hash
-                    assert hash_str.startswith(
-                        "sha256="
-                    ), f"Invalid hash format for {path}"
-                    expected_hash = hash_str[7:]  # Remove "sha256=" prefix
-
-                    with zf.open(path) as entry:
-                        content = entry.read()
-                        actual_hash = (
-                            base64.urlsafe_b64encode(hashlib.sha256(content).digest())
-                            .decode("ascii")
-                            .rstrip("=")
-                        )
-
-                        assert actual_hash == expected_hash, f"Hash mismatch for {path}"
-
-                    # Verify size
-                    if size_str:
-                        with zf.open(path) as entry:
-                            content = entry.read()
-                            assert len(content) == int(
-                                size_str
-                            ), f"Size mismatch for {path}"
+
+            # Rows here are plain path,hash,size — no quoting, so a
+            # straight split avoids the csv dialect machinery
+            assert '"' not in record_content, "unexpected quoting in RECORD"
+            for line in record_content.splitlines():
+                parts = line.split(",", 2)
+                if len(parts) < 3:
+                    continue
+
+                path, hash_str, size_str = parts
+
+                # Skip RECORD itself
+                if path.endswith("/RECORD"):
+                    assert hash_str == "", "RECORD should have empty hash"
+                    continue
+
+                if not hash_str:
+                    continue
+
+                # Verify hash
+                assert hash_str.startswith(
+                    "sha256="
+                ), f"Invalid hash format for {path}"
+                expected_hash = hash_str[7:]  # Remove "sha256=" prefix
+
+                # Stream the entry once through the hasher, checking
+                # both hash and size without materializing the file
+                with zf.open(path) as entry:
+                    actual_hash, actual_size = _hash_and_size_entry(entry)
+
+                assert actual_hash == expected_hash, f"Hash mismatch for {path}"
+
+                if size_str:
+                    assert actual_size == int(
+                        size_str
+                    ), f"Size mismatch for {path}"
@@ -23,9 +23,15 @@ Known Issue:
     This is a bug in the wheel writing code that needs to be fixed.
 """
 
+import fcntl
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import urllib.error
+import urllib.parse
+import urllib.request
 from pathlib import Path
 
 import pytest
@@ -35,6 +41,9 @@ from editwheel import WheelEditor
 # Using a CUDA wheel to test with larger, more complex wheels
 TORCH_PACKAGE = "torch==2.5.1+cu124"
 TORCH_INDEX_URL = "https://download.pytorch.org/whl/cu124"
+# Known filename on the index above; lets us skip pip's resolver and
+# fetch the wheel with a plain streaming GET
+TORCH_WHEEL_FILENAME = "torch-2.5.1+cu124-cp313-cp313-linux_x86_64.whl"
 # Python version to use for testing (must match the downloaded wheel)
 TEST_PYTHON_VERSION = "3.13"
 
@@ -57,6 +66,20 @@ def download_torch_wheel(dest_dir: Path) -> Path:
 
     Returns the path to the downloaded wheel file.
     """
+    # The index URL + filename are known, so try a plain streaming GET
+    # first — no uv dispatcher, pip subprocess, or resolver walk. Fall
+    # back to pip if the URL goes stale on a future torch bump.
+    url = f"{TORCH_INDEX_URL}/{urllib.parse.quote(TORCH_WHEEL_FILENAME)}"
+    out = dest_dir / TORCH_WHEEL_FILENAME
+    part = out.with_suffix(".part")
+    try:
+        with urllib.request.urlopen(url) as resp, open(part, "wb") as f:
+            shutil.copyfileobj(resp, f, 1 << 20)
+        part.rename(out)
+        return out
+    except (urllib.error.URLError, OSError):
+        part.unlink(missing_ok=True)
+
     # Use uv run pip download to fetch the wheel (uv doesn't have a native download command)
     # We download for the current platform since cross-platform download is tricky
     result = subprocess.run(
@@ -95,20 +118,79 @@ def download_torch_wheel(dest_dir: Path) -> Path:
     return wheels[0]
 
 
-@pytest.fixture(scope="module")
-def torch_wheel(tmp_path_factory) -> Path:
-    """Fixture that downloads a torch wheel once per test module."""
-    import os
+@pytest.fixture(scope="session")
+def torch_wheel() -> Path:
+    """Fixture providing the torch wheel, cached across pytest sessions.
+
+    The ~2.5 GB download lands in a user-level cache directory
+    (override with EDITWHEEL_WHEEL_CACHE) instead of a throwaway tmp
+    dir, so only the first run on a machine pays for the network. A
+    file lock keeps parallel workers from downloading concurrently.
+    """
     if os.environ.get("CI"):
         pytest.skip("Torch wheel download tests disabled in CI")
-    download_dir = tmp_path_factory.mktemp("wheels")
-    wheel_path = download_torch_wheel(download_dir)
-    print(f"\nDownloaded wheel: {wheel_path}")
+
+    cache_dir = Path(
+        os.environ.get(
+            "EDITWHEEL_WHEEL_CACHE", Path.home() / ".cache" / "editwheel-tests"
+        )
+    )
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(cache_dir / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            wheels = sorted(cache_dir.glob("torch-*.whl"))
+            if wheels:
+                wheel_path = wheels[0]
+                print(f"\nUsing cached wheel: {wheel_path}")
+            else:
+                wheel_path = download_torch_wheel(cache_dir)
+                print(f"\nDownloaded wheel: {wheel_path}")
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
     print(f"Size: {wheel_path.stat().st_size:,} bytes")
     return wheel_path
 
 
-def test_uv_install_edited_wheel(tmp_path: Path, torch_wheel: Path) -> None:
+@pytest.fixture(scope="session")
+def uv_test_project(tmp_path_factory) -> Path:
+    """A uv project with a synced venv, built once per session.
+
+    The tests only run dry-run installs against it, so the project is
+    effectively read-only and safe to share. pip is added up front for
+    the pip-vs-uv comparison test.
+    """
+    project = tmp_path_factory.mktemp("uv_test_project")
+    subprocess.run(
+        ["uv", "init", "--python", TEST_PYTHON_VERSION],
+        cwd=project,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    # Create the venv to ensure uv pip uses the correct Python
+    subprocess.run(
+        ["uv", "sync"],
+        cwd=project,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    subprocess.run(
+        ["uv", "add", "pip", "--dev"],
+        cwd=project,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return project
+
+
+def test_uv_install_edited_wheel(
+    tmp_path: Path, torch_wheel: Path, uv_test_project: Path
+) -> None:
     """Test that an edited wheel can be installed with uv pip install."""
     wheel_path = torch_wheel
 
@@ -131,22 +213,8 @@ def test_uv_install_edited_wheel(tmp_path: Path, torch_wheel: Path) -> None:
     print(f"New version: {new_version}")
     print(f"Edited wheel size: {edited_wheel.stat().st_size:,} bytes")
 
-    # Create a clean uv project with Python 3.13 for testing (matches downloaded wheel)
-    test_project = tmp_path / "test_project"
-    test_project.mkdir()
-    subprocess.run(
-        ["uv", "init", "--python", TEST_PYTHON_VERSION],
-        cwd=test_project,
-        capture_output=True,
-        check=True,
-    )
-    # Create the venv to ensure uv pip uses the correct Python
-    subprocess.run(
-        ["uv", "sync"],
-        cwd=test_project,
-        capture_output=True,
-        check=True,
-    )
+    # Shared session project (matches the downloaded wheel's Python)
+    test_project = uv_test_project
 
     # Test uv pip install (dry-run to avoid actually installing the large wheel)
     result = subprocess.run(
@@ -174,7 +242,9 @@ def test_uv_install_edited_wheel(tmp_path: Path, torch_wheel: Path) -> None:
     )
 
 
-def test_pip_vs_uv_comparison(tmp_path: Path, torch_wheel: Path) -> None:
+def test_pip_vs_uv_comparison(
+    tmp_path: Path, torch_wheel: Path, uv_test_project: Path
+) -> None:
     """Compare pip and uv behavior for the same edited wheel."""
     wheel_path = torch_wheel
 
@@ -188,30 +258,10 @@ def test_pip_vs_uv_comparison(tmp_path: Path, torch_wheel: Path) -> None:
     )
     editor.save(str(edited_wheel))
 
-    # Create a clean uv project with Python 3.13 for testing (matches downloaded wheel)
-    test_project = tmp_path / "test_project"
-    test_project.mkdir()
-    subprocess.run(
-        ["uv", "init", "--python", TEST_PYTHON_VERSION],
-        cwd=test_project,
-        capture_output=True,
-        check=True,
-    )
-    # Create the venv to ensure uv pip uses the correct Python
-    subprocess.run(
-        ["uv", "sync"],
-        cwd=test_project,
-        capture_output=True,
-        check=True,
-    )
+    # Shared session project; pip was added as a dev dependency when
+    # the fixture built it
+    test_project = uv_test_project
 
-    # Test with pip (install pip first, then use uv run pip)
-    subprocess.run(
-        ["uv", "add", "pip", "--dev"],
-        cwd=test_project,
-        capture_output=True,
-        check=True,
-    )
     pip_result = subprocess.run(
         [
             "uv",
@@ -309,14 +359,16 @@ def _run_test_with_wheel(wheel_path: Path) -> None:
         subprocess.run(
             ["uv", "init", "--python", TEST_PYTHON_VERSION],
             cwd=test_project,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
         # Create the venv to ensure uv pip uses it
         subprocess.run(
             ["uv", "sync"],
             cwd=test_project,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
         print(f"Created uv project with Python {TEST_PYTHON_VERSION}")
@@ -9,32 +9,27 @@ to all Python packaging standards and tooling requirements.
 """
 
 import base64
-import csv
 import hashlib
 import io
-import tempfile
+import logging
 import zipfile
 from pathlib import Path
 
 import pytest
 from editwheel import normalize_dist_info_name, WheelEditor
 
+logger = logging.getLogger(__name__)
 
-def create_test_wheel(temp_dir: Path) -> Path:
-    """Create a minimal but valid wheel file for testing."""
-    wheel_path = temp_dir / "test_package-1.0.0-py3-none-any.whl"
 
-    with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Create package files
-        zf.writestr(
-            "test_package/__init__.py", "# Test package\n__version__ = '1.0.0'\n"
-        )
-        zf.writestr(
-            "test_package/module.py", "def hello():\n    return 'Hello, World!'\n"
-        )
-
-        # Create METADATA
-        metadata = """Metadata-Version: 2.1
+# Fixture wheel contents as (path, bytes) pairs, pre-encoded once at
+# import. The RECORD hash loop and the zip writes both consume the same
+# bytes, so nothing is re-encoded per wheel build.
+_TEST_WHEEL_FILES = (
+    ("test_package/__init__.py", b"# Test package\n__version__ = '1.0.0'\n"),
+    ("test_package/module.py", b"def hello():\n    return 'Hello, World!'\n"),
+    (
+        "test_package-1.0.0.dist-info/METADATA",
+        b"""Metadata-Version: 2.1
 Name: test-package
 Version: 1.0.0
 Summary: A test package for wheel editor validation
@@ -48,708 +43,683 @@ Requires-Dist: requests>=2.20.0
 
 This is a test package created to validate the wheel editor.
 It contains minimal content but follows all wheel standards.
-"""
-        zf.writestr("test_package-1.0.0.dist-info/METADATA", metadata)
-
-        # Create WHEEL file
-        wheel_info = """Wheel-Version: 1.0
+""",
+    ),
+    (
+        "test_package-1.0.0.dist-info/WHEEL",
+        b"""Wheel-Version: 1.0
 Generator: test-wheel-creator (1.0.0)
 Root-Is-Purelib: true
 Tag: py3-none-any
-"""
-        zf.writestr("test_package-1.0.0.dist-info/WHEEL", wheel_info)
-
-        # Create top_level.txt
-        zf.writestr("test_package-1.0.0.dist-info/top_level.txt", "test_package\n")
-
-        # Create RECORD file with hashes
-        record_entries = []
-        files_to_hash = [
-            ("test_package/__init__.py", "# Test package\n__version__ = '1.0.0'\n"),
-            (
-                "test_package/module.py",
-                "def hello():\n    return 'Hello, World!'\n",
+""",
+    ),
+    ("test_package-1.0.0.dist-info/top_level.txt", b"test_package\n"),
+)
+
+
+# RECORD is a pure function of the constant file table above, so hash at
+# import and keep the serialized text as a constant too. No fixture path
+# needs CSV quoting, so the plain join matches csv.writer byte for byte;
+# the final row is RECORD itself with empty hash/size.
+_TEST_WHEEL_RECORD = (
+    "".join(
+        "{},sha256={},{}\r\n".format(
+            path,
+            # A 32-byte digest encodes to 43 chars plus exactly one "="
+            # pad, so a fixed slice replaces the rstrip scan
+            base64.urlsafe_b64encode(hashlib.sha256(content).digest())[:-1].decode(
+                "ascii"
             ),
-            ("test_package-1.0.0.dist-info/METADATA", metadata),
-            ("test_package-1.0.0.dist-info/WHEEL", wheel_info),
-            ("test_package-1.0.0.dist-info/top_level.txt", "test_package\n"),
-        ]
-
-        for filename, content in files_to_hash:
-            content_bytes = content.encode("utf-8")
-            hash_digest = hashlib.sha256(content_bytes).digest()
-            hash_str = base64.urlsafe_b64encode(hash_digest).decode("ascii").rstrip("=")
-            size = len(content_bytes)
-            record_entries.append([filename, f"sha256={hash_str}", str(size)])
-
-        # RECORD file itself has empty hash
-        record_entries.append(["test_package-1.0.0.dist-info/RECORD", "", ""])
+            len(content),
+        )
+        for path, content in _TEST_WHEEL_FILES
+    )
+    + "test_package-1.0.0.dist-info/RECORD,,\r\n"
+)
+
+
+def _write_test_wheel(fp) -> None:
+    """Write the minimal test wheel to a path or file object."""
+    # STORED skips the deflate call chain entirely; the fixture is a few
+    # hundred bytes, so compression buys nothing for an ephemeral wheel.
+    with zipfile.ZipFile(fp, "w", zipfile.ZIP_STORED) as zf:
+        for path, content in _TEST_WHEEL_FILES:
+            zf.writestr(path, content)
+        zf.writestr("test_package-1.0.0.dist-info/RECORD", _TEST_WHEEL_RECORD)
+
+
+def _iter_record(f):
+    """Yield (path, hash, size) rows from a binary RECORD stream.
+
+    Decodes incrementally through TextIOWrapper instead of
+    read().decode(), so the RECORD never exists as a whole-file bytes
+    plus str copy. The paths in these wheels never need CSV quoting, so
+    one split per line replaces the csv.reader state machine.
+    """
+    for line in io.TextIOWrapper(f, encoding="utf-8", newline=""):
+        line = line.rstrip("\r\n")
+        if line:
+            yield line.split(",", 2)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_wheel_bytes() -> bytes:
+    """The deterministic test-wheel bytes, built once per session."""
+    buf = io.BytesIO()
+    _write_test_wheel(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def test_wheel(tmp_path, prebuilt_wheel_bytes) -> Path:
+    """Per-test copy of the prebuilt wheel — one write_bytes call
+    instead of re-hashing and re-compressing five files per test."""
+    wheel_path = tmp_path / "test_package-1.0.0-py3-none-any.whl"
+    wheel_path.write_bytes(prebuilt_wheel_bytes)
+    return wheel_path
 
-        # Write RECORD
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerows(record_entries)
-        zf.writestr("test_package-1.0.0.dist-info/RECORD", output.getvalue())
 
-    return wheel_path
+@pytest.fixture
+def editor(test_wheel) -> WheelEditor:
+    """A WheelEditor over a fresh per-test copy of the wheel."""
+    return WheelEditor(str(test_wheel))
 
 
 class TestNormalizeDistInfoName:
     """Tests for normalize_dist_info_name function."""
 
-    def test_hyphen_to_underscore(self):
-        assert normalize_dist_info_name("my-package") == "my_package"
-
-    def test_dot_to_underscore(self):
-        assert normalize_dist_info_name("my.package") == "my_package"
-
-    def test_multiple_separators(self):
-        assert normalize_dist_info_name("my-package.name") == "my_package_name"
-
-    def test_already_normalized(self):
-        assert normalize_dist_info_name("my_package") == "my_package"
-
-    def test_mixed_case_preserved(self):
-        # Case should be preserved in dist-info names
-        assert normalize_dist_info_name("My-Package") == "My_Package"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("my-package", "my_package"),  # hyphen to underscore
+            ("my.package", "my_package"),  # dot to underscore
+            ("my-package.name", "my_package_name"),  # multiple separators
+            ("my_package", "my_package"),  # already normalized
+            ("My-Package", "My_Package"),  # case is preserved
+        ],
+    )
+    def test_normalize(self, name, expected):
+        assert normalize_dist_info_name(name) == expected
 
 
 class TestLoadWheel:
     """Tests for loading wheel files."""
 
-    def test_load_valid_wheel(self):
+    def test_load_valid_wheel(self, editor):
         """Test that WheelEditor can load a valid wheel file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
-
-            assert editor.name == "test-package"
-            assert editor.version == "1.0.0"
-            assert editor.summary == "A test package for wheel editor validation"
-            assert editor.author == "Test Author"
-            assert editor.author_email == "test@example.com"
-            assert editor.license == "MIT"
-            assert editor.requires_python == ">=3.6"
-            assert "requests>=2.20.0" in editor.requires_dist
-
-    def test_invalid_wheel_path_raises_error(self):
+
+        assert editor.name == "test-package"
+        assert editor.version == "1.0.0"
+        assert editor.summary == "A test package for wheel editor validation"
+        assert editor.author == "Test Author"
+        assert editor.author_email == "test@example.com"
+        assert editor.license == "MIT"
+        assert editor.requires_python == ">=3.6"
+        assert "requests>=2.20.0" in editor.requires_dist
+
+    def test_invalid_wheel_path_raises_error(self, tmp_path):
         """Test that invalid wheel paths raise appropriate errors."""
         with pytest.raises(FileNotFoundError):
             WheelEditor("/nonexistent/wheel.whl")
 
-        with tempfile.NamedTemporaryFile(suffix=".txt") as f:
-            with pytest.raises(ValueError, match=".whl"):
-                WheelEditor(f.name)
+        not_a_wheel = tmp_path / "not_a_wheel.txt"
+        not_a_wheel.touch()
+        with pytest.raises(ValueError, match=".whl"):
+            WheelEditor(str(not_a_wheel))
 
-    def test_repr(self):
+    def test_repr(self, editor):
         """Test __repr__ output."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
-            repr_str = repr(editor)
+        repr_str = repr(editor)
 
-            assert "test-package" in repr_str
-            assert "1.0.0" in repr_str
+        assert "test-package" in repr_str
+        assert "1.0.0" in repr_str
 
 
 class TestEditMetadata:
     """Tests for editing metadata fields."""
 
-    def test_edit_metadata_fields(self):
+    def test_edit_metadata_fields(self, editor):
         """Test editing various metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
-
-            # Edit simple fields
-            editor.version = "1.0.1"
-            editor.summary = "Modified summary"
-            editor.author = "New Author"
-            editor.author_email = "new@example.com"
-            editor.license = "Apache-2.0"
-            editor.requires_python = ">=3.7"
-
-            # Verify changes in memory
-            assert editor.version == "1.0.1"
-            assert editor.summary == "Modified summary"
-            assert editor.author == "New Author"
-            assert editor.author_email == "new@example.com"
-            assert editor.license == "Apache-2.0"
-            assert editor.requires_python == ">=3.7"
-
-    def test_edit_list_fields(self):
-        """Test editing list-based metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        # Edit simple fields
+        editor.version = "1.0.1"
+        editor.summary = "Modified summary"
+        editor.author = "New Author"
+        editor.author_email = "new@example.com"
+        editor.license = "Apache-2.0"
+        editor.requires_python = ">=3.7"
+
+        # Verify changes in memory
+        assert editor.version == "1.0.1"
+        assert editor.summary == "Modified summary"
+        assert editor.author == "New Author"
+        assert editor.author_email == "new@example.com"
+        assert editor.license == "Apache-2.0"
+        assert editor.requires_python == ">=3.7"
+
+    def test_apply_batch(self, editor):
+        """Test applying several field changes in one call."""
+
+        editor.apply(
+            {
+                "version": "1.0.1",
+                "summary": "Batched summary",
+                "author": "Batch Author",
+            }
+        )
 
-            # Edit classifiers
-            classifiers = editor.classifiers
-            classifiers.append("Development Status :: 4 - Beta")
-            classifiers.append("Topic :: Software Development :: Testing")
-            editor.classifiers = classifiers
+        assert editor.version == "1.0.1"
+        assert editor.summary == "Batched summary"
+        assert editor.author == "Batch Author"
 
-            assert "Development Status :: 4 - Beta" in editor.classifiers
-            assert "Topic :: Software Development :: Testing" in editor.classifiers
+    def test_apply_unknown_field_raises(self, editor):
+        """Test that apply rejects unknown field names."""
 
-            # Edit dependencies
-            deps = editor.requires_dist
-            deps.append("click>=8.0.0")
-            editor.requires_dist = deps
+        with pytest.raises(ValueError, match="unknown field"):
+            editor.apply({"no_such_field": "x"})
 
-            assert "click>=8.0.0" in editor.requires_dist
+    def test_edit_list_fields(self, editor):
+        """Test editing list-based metadata fields."""
+
+        # Edit classifiers
+        classifiers = editor.classifiers
+        classifiers.append("Development Status :: 4 - Beta")
+        classifiers.append("Topic :: Software Development :: Testing")
+        editor.classifiers = classifiers
+
+        assert "Development Status :: 4 - Beta" in editor.classifiers
+        assert "Topic :: Software Development :: Testing" in editor.classifiers
+
+        # Edit dependencies
+        deps = editor.requires_dist
+        deps.append("click>=8.0.0")
+        editor.requires_dist = deps
+
+        assert "click>=8.0.0" in editor.requires_dist
 
 
 class TestGetSetMetadata:
     """Tests for get_metadata and set_metadata methods."""
 
-    def test_get_metadata_string_field(self):
+    def test_get_metadata_string_field(self, editor):
         """Test getting single-value metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        assert editor.get_metadata("Name") == "test-package"
+        assert editor.get_metadata("Version") == "1.0.0"
+        assert editor.get_metadata("Author") == "Test Author"
 
-            assert editor.get_metadata("Name") == "test-package"
-            assert editor.get_metadata("Version") == "1.0.0"
-            assert editor.get_metadata("Author") == "Test Author"
-
-    def test_get_metadata_list_field(self):
+    def test_get_metadata_list_field(self, editor):
         """Test getting multi-value metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
 
-            classifiers = editor.get_metadata("Classifier")
-            assert isinstance(classifiers, list)
-            assert len(classifiers) == 2
+        classifiers = editor.get_metadata("Classifier")
+        assert isinstance(classifiers, list)
+        assert len(classifiers) == 2
 
-    def test_set_metadata_string_field(self):
+    def test_set_metadata_string_field(self, editor):
         """Test setting single-value metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
 
-            editor.set_metadata("Author", "New Author")
-            assert editor.get_metadata("Author") == "New Author"
+        editor.set_metadata("Author", "New Author")
+        assert editor.get_metadata("Author") == "New Author"
 
-    def test_set_metadata_list_field(self):
+    def test_set_metadata_list_field(self, editor):
         """Test setting multi-value metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        new_classifiers = ["License :: OSI Approved :: MIT License"]
+        editor.set_metadata("Classifier", new_classifiers)
+        assert editor.get_metadata("Classifier") == new_classifiers
 
-            new_classifiers = ["License :: OSI Approved :: MIT License"]
-            editor.set_metadata("Classifier", new_classifiers)
-            assert editor.get_metadata("Classifier") == new_classifiers
-
-    def test_custom_metadata_fields(self):
+    def test_custom_metadata_fields(self, editor, tmp_path):
         """Test setting custom metadata fields."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        # Set custom fields
+        editor.set_metadata("Home-page", "https://example.com/test")
+        editor.set_metadata("Download-URL", "https://example.com/download")
 
-            # Set custom fields
-            editor.set_metadata("Home-page", "https://example.com/test")
-            editor.set_metadata("Download-URL", "https://example.com/download")
+        # Save and verify
+        output_path = tmp_path / "edited.whl"
+        editor.save(str(output_path))
 
-            # Save and verify
-            output_path = temp_path / "edited.whl"
-            editor.save(str(output_path))
+        new_editor = WheelEditor(str(output_path))
+        assert new_editor.get_metadata("Home-page") == "https://example.com/test"
+        assert (
+            new_editor.get_metadata("Download-URL")
+            == "https://example.com/download"
+        )
 
-            new_editor = WheelEditor(str(output_path))
-            assert new_editor.get_metadata("Home-page") == "https://example.com/test"
-            assert (
-                new_editor.get_metadata("Download-URL")
-                == "https://example.com/download"
-            )
+
+class TestAsDict:
+    """Tests for the as_dict batch getter."""
+
+    def test_as_dict_matches_getters(self, editor):
+        """as_dict should return the same values as the individual getters."""
+
+        metadata = editor.as_dict()
+
+        assert metadata["name"] == editor.name
+        assert metadata["version"] == editor.version
+        assert metadata["summary"] == editor.summary
+        assert metadata["classifiers"] == editor.classifiers
+        assert metadata["requires_dist"] == editor.requires_dist
+        assert metadata["platform_tag"] == editor.platform_tag
+        assert metadata["dist_info_dir"] == editor.dist_info_dir
+
+    def test_as_dict_reflects_edits(self, editor):
+        """as_dict should see pending in-memory edits."""
+
+        editor.version = "9.9.9"
+
+        assert editor.as_dict()["version"] == "9.9.9"
 
 
 class TestSaveWheel:
     """Tests for saving edited wheels."""
 
-    def test_save_edited_wheel(self):
+    def test_save_edited_wheel(self, editor, test_wheel, tmp_path):
         """Test saving an edited wheel maintains validity."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        # Make edits
+        editor.version = "1.0.1"
+        editor.summary = "Modified test package"
 
-            # Make edits
-            editor.version = "1.0.1"
-            editor.summary = "Modified test package"
+        # Save to new file
+        output_path = tmp_path / "test_package-1.0.1-py3-none-any.whl"
+        editor.save(str(output_path))
 
-            # Save to new file
-            output_path = temp_path / "test_package-1.0.1-py3-none-any.whl"
-            editor.save(str(output_path))
+        # Verify file exists and hasn't blown up in size — a metadata
+        # edit should leave the output within the same ballpark as the
+        # input, so a silent compression regression trips this bound
+        assert output_path.exists()
+        assert 0 < output_path.stat().st_size < 2 * test_wheel.stat().st_size
 
-            # Verify file exists
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+        # Load the saved wheel and verify changes
+        new_editor = WheelEditor(str(output_path))
+        assert new_editor.version == "1.0.1"
+        assert new_editor.summary == "Modified test package"
 
-            # Load the saved wheel and verify changes
-            new_editor = WheelEditor(str(output_path))
-            assert new_editor.version == "1.0.1"
-            assert new_editor.summary == "Modified test package"
-
-    def test_overwrite_original_wheel(self):
+    def test_overwrite_original_wheel(self, test_wheel):
         """Test that save() without output_path overwrites the original."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        editor = WheelEditor(str(test_wheel))
 
-            # Make changes
-            editor.version = "1.0.1"
-            editor.summary = "Overwritten wheel"
+        # Make changes
+        editor.version = "1.0.1"
+        editor.summary = "Overwritten wheel"
 
-            # Save without specifying output path
-            editor.save()
+        # Save without specifying output path
+        editor.save()
 
-            # Verify the original file was modified
-            assert test_wheel.exists()
+        # Verify the original file was modified
+        assert test_wheel.exists()
 
-            # Load and verify changes
-            new_editor = WheelEditor(str(test_wheel))
-            assert new_editor.version == "1.0.1"
-            assert new_editor.summary == "Overwritten wheel"
+        # Load and verify changes
+        new_editor = WheelEditor(str(test_wheel))
+        assert new_editor.version == "1.0.1"
+        assert new_editor.summary == "Overwritten wheel"
 
-    def test_record_file_updated(self):
+    def test_record_file_updated(self, editor, tmp_path):
         """Test that RECORD file is properly updated with new hashes."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
-
-            # Make a change that affects file content
-            editor.version = "2.0.0"
-            editor.description = "New description added"
-
-            # Save edited wheel
-            output_path = temp_path / "test_package-1.0.1-py3-none-any.whl"
-            editor.save(str(output_path))
-
-            # Check RECORD file in the edited wheel
-            with zipfile.ZipFile(output_path, "r") as zf:
-                record_files = [
-                    name for name in zf.namelist() if name.endswith("/RECORD")
-                ]
-
-                assert len(record_files) == 1, "Should have exactly one RECORD file"
-
-                with zf.open(record_files[0]) as f:
-                    record_content = f.read().decode("utf-8")
-
-                    # Parse RECORD
-                    reader = csv.reader(io.StringIO(record_content))
-                    records = list(reader)
-
-                    # Verify RECORD has entries
-                    assert len(records) > 0, "RECORD should not be empty"
-
-                    # Check format of non-RECORD entries
-                    for row in records:
-                        if len(row) >= 3:
-                            path, hash_str, size = row[0], row[1], row[2]
-                            if not path.endswith("/RECORD"):
-                                if hash_str:
-                                    assert hash_str.startswith(
-                                        "sha256="
-                                    ), f"Hash should be SHA256 format for {path}"
-                                if size:
-                                    assert (
-                                        size.isdigit()
-                                    ), f"Size should be numeric for {path}"
-
-    def test_metadata_version_preserved(self):
-        """Test that Metadata-Version is preserved correctly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
-            original_metadata_version = editor.get_metadata("Metadata-Version")
+        # Make a change that affects file content
+        editor.version = "2.0.0"
+        editor.description = "New description added"
 
-            # Edit other fields
-            editor.version = "1.0.1"
+        # Save edited wheel
+        output_path = tmp_path / "test_package-1.0.1-py3-none-any.whl"
+        editor.save(str(output_path))
 
-            # Save
-            output_path = temp_path / "edited.whl"
-            editor.save(str(output_path))
+        # Check RECORD file in the edited wheel
+        with zipfile.ZipFile(output_path, "r") as zf:
+            # Scan NameToInfo (already built during central-dir parse)
+            # rather than materializing namelist()'s list copy
+            record_iter = (n for n in zf.NameToInfo if n.endswith("/RECORD"))
+            record_name = next(record_iter, None)
 
-            # Check metadata version is preserved
-            new_editor = WheelEditor(str(output_path))
+            assert record_name is not None, "Should have exactly one RECORD file"
             assert (
-                new_editor.get_metadata("Metadata-Version") == original_metadata_version
-            )
-
-
-class TestDependencyEditing:
-    """Tests for editing dependencies."""
+                next(record_iter, None) is None
+            ), "Should have exactly one RECORD file"
+
+            with zf.open(record_name) as f:
+                # Parse RECORD
+                records = list(_iter_record(f))
+
+                # Verify RECORD has entries
+                assert len(records) > 0, "RECORD should not be empty"
+
+                # Check format of non-RECORD entries
+                for row in records:
+                    if len(row) >= 3:
+                        path, hash_str, size = row[0], row[1], row[2]
+                        if not path.endswith("/RECORD"):
+                            if hash_str:
+                                assert hash_str.startswith(
+                                    "sha256="
+                                ), f"Hash should be SHA256 format for {path}"
+                            if size:
+                                assert (
+                                    size.isdigit()
+                                ), f"Size should be numeric for {path}"
+
+    def test_metadata_version_preserved(self, editor, tmp_path):
+        """Test that Metadata-Version is preserved correctly."""
 
-    def test_duplicate_dependency_different_version(self):
-        """Test adding the same dependency with a different version creates duplicates."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
+        original_metadata_version = editor.get_metadata("Metadata-Version")
 
-            editor = WheelEditor(str(test_wheel))
+        # Edit other fields
+        editor.version = "1.0.1"
 
-            # Original wheel has requests>=2.20.0
-            assert "requests>=2.20.0" in editor.requires_dist
-            original_count = len(editor.requires_dist)
+        # Save
+        output_path = tmp_path / "edited.whl"
+        editor.save(str(output_path))
 
-            # Add the same dependency with a different version
-            deps = editor.requires_dist
-            deps.append("requests>=3.0.0")
-            editor.requires_dist = deps
+        # Check metadata version is preserved
+        new_editor = WheelEditor(str(output_path))
+        assert (
+            new_editor.get_metadata("Metadata-Version") == original_metadata_version
+        )
 
-            # Should now have both versions (duplicates)
-            assert "requests>=2.20.0" in editor.requires_dist
-            assert "requests>=3.0.0" in editor.requires_dist
-            assert len(editor.requires_dist) == original_count + 1
 
-            # Save and verify duplicates persist
-            output_path = temp_path / "duplicate_deps.whl"
-            editor.save(str(output_path))
+class TestDependencyEditing:
+    """Tests for editing dependencies."""
 
-            new_editor = WheelEditor(str(output_path))
-            assert "requests>=2.20.0" in new_editor.requires_dist
-            assert "requests>=3.0.0" in new_editor.requires_dist
+    def _roundtrip_deps(self, editor, tmp_path, new_deps, name):
+        """Assign a deps list, save, and return the reloaded deps."""
+        editor.requires_dist = new_deps
+        output_path = tmp_path / name
+        editor.save(str(output_path))
+        return WheelEditor(str(output_path)).requires_dist
 
-    def test_replace_dependency_version(self):
-        """Test replacing a dependency with a different version."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
+    def test_duplicate_dependency_different_version(self, editor, tmp_path):
+        """Test adding the same dependency with a different version creates duplicates."""
 
-            editor = WheelEditor(str(test_wheel))
+        # Original wheel has requests>=2.20.0
+        deps = editor.requires_dist
+        assert "requests>=2.20.0" in deps
+        original_count = len(deps)
 
-            # Original wheel has requests>=2.20.0
-            assert "requests>=2.20.0" in editor.requires_dist
+        # Add the same dependency with a different version
+        deps.append("requests>=3.0.0")
+        saved_deps = self._roundtrip_deps(
+            editor, tmp_path, deps, "duplicate_deps.whl"
+        )
 
-            # Replace the dependency with a new version
-            deps = editor.requires_dist
-            deps = [
-                dep if not dep.startswith("requests") else "requests>=3.0.0"
-                for dep in deps
-            ]
-            editor.requires_dist = deps
-
-            # Should only have the new version
-            assert "requests>=2.20.0" not in editor.requires_dist
-            assert "requests>=3.0.0" in editor.requires_dist
-
-            # Save and verify replacement persists
-            output_path = temp_path / "replaced_deps.whl"
-            editor.save(str(output_path))
-
-            new_editor = WheelEditor(str(output_path))
-            assert "requests>=2.20.0" not in new_editor.requires_dist
-            assert "requests>=3.0.0" in new_editor.requires_dist
-
-    def test_multiple_version_specifiers(self):
-        """Test handling dependencies with multiple version specifiers."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
-
-            # Add various version specifiers for the same package
-            deps = editor.requires_dist
-            deps.extend(
-                [
-                    "requests==2.28.0",  # Exact version
-                    "requests<3.0.0",  # Upper bound
-                    "requests!=2.25.0",  # Not equal
-                    "requests~=2.20",  # Compatible release
-                ]
-            )
-            editor.requires_dist = deps
+        # Should now have both versions (duplicates)
+        assert "requests>=2.20.0" in saved_deps
+        assert "requests>=3.0.0" in saved_deps
+        assert len(saved_deps) == original_count + 1
 
-            # All should be present (even though they may conflict)
-            assert "requests>=2.20.0" in editor.requires_dist  # Original
-            assert "requests==2.28.0" in editor.requires_dist
-            assert "requests<3.0.0" in editor.requires_dist
-            assert "requests!=2.25.0" in editor.requires_dist
-            assert "requests~=2.20" in editor.requires_dist
+    def test_replace_dependency_version(self, editor, tmp_path):
+        """Test replacing a dependency with a different version."""
 
-            # Save and verify all are preserved
-            output_path = temp_path / "multi_version_deps.whl"
-            editor.save(str(output_path))
+        # Original wheel has requests>=2.20.0
+        deps = editor.requires_dist
+        assert "requests>=2.20.0" in deps
 
-            new_editor = WheelEditor(str(output_path))
-            assert (
-                len(
-                    [
-                        dep
-                        for dep in new_editor.requires_dist
-                        if dep.startswith("requests")
-                    ]
-                )
-                == 5
-            )
+        # Replace the dependency with a new version
+        deps = [
+            dep if not dep.startswith("requests") else "requests>=3.0.0"
+            for dep in deps
+        ]
+        saved_deps = self._roundtrip_deps(
+            editor, tmp_path, deps, "replaced_deps.whl"
+        )
 
-    def test_dependency_with_extras(self):
-        """Test handling dependencies with extras and markers."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
-
-            # Add dependencies with various extras and markers
-            deps = editor.requires_dist
-            deps.extend(
-                [
-                    "requests[security]>=2.20.0",
-                    "requests[socks]>=2.20.0",
-                    'requests>=3.0.0; python_version>="3.8"',
-                    'requests>=2.28.0; sys_platform=="win32"',
-                ]
-            )
-            editor.requires_dist = deps
-
-            # All variations should be present
-            assert "requests>=2.20.0" in editor.requires_dist  # Original
-            assert "requests[security]>=2.20.0" in editor.requires_dist
-            assert "requests[socks]>=2.20.0" in editor.requires_dist
-            assert 'requests>=3.0.0; python_version>="3.8"' in editor.requires_dist
-            assert 'requests>=2.28.0; sys_platform=="win32"' in editor.requires_dist
-
-            # Save and verify
-            output_path = temp_path / "extras_deps.whl"
-            editor.save(str(output_path))
-
-            new_editor = WheelEditor(str(output_path))
-            requests_deps = [
-                dep for dep in new_editor.requires_dist if "requests" in dep
-            ]
-            assert len(requests_deps) == 5
+        # Should only have the new version
+        assert "requests>=2.20.0" not in saved_deps
+        assert "requests>=3.0.0" in saved_deps
+
+    @pytest.mark.parametrize(
+        "added_deps",
+        [
+            # Multiple version specifiers for the same package (even
+            # conflicting ones are kept verbatim)
+            [
+                "requests==2.28.0",  # Exact version
+                "requests<3.0.0",  # Upper bound
+                "requests!=2.25.0",  # Not equal
+                "requests~=2.20",  # Compatible release
+            ],
+            # Extras and environment markers
+            [
+                "requests[security]>=2.20.0",
+                "requests[socks]>=2.20.0",
+                'requests>=3.0.0; python_version>="3.8"',
+                'requests>=2.28.0; sys_platform=="win32"',
+            ],
+        ],
+        ids=["version_specifiers", "extras_and_markers"],
+    )
+    def test_dependency_variants_roundtrip(self, editor, tmp_path, added_deps):
+        """Test that dependency variants survive an edit/save round-trip."""
+
+        deps = editor.requires_dist
+        deps.extend(added_deps)
+        saved_deps = self._roundtrip_deps(editor, tmp_path, deps, "variant_deps.whl")
+
+        # Each requires_dist read crosses the FFI and builds a fresh
+        # list, so check everything against the one reloaded snapshot
+        saved_set = set(saved_deps)
+        assert "requests>=2.20.0" in saved_set  # Original
+        for dep in added_deps:
+            assert dep in saved_set
+        assert sum(d.startswith("requests") for d in saved_deps) == len(added_deps) + 1
 
 
 class TestEndToEnd:
     """End-to-end tests."""
 
-    def test_e2e(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Step 1: Create test wheel
-            print("\n1. Creating test wheel...")
-            wheel_path = create_test_wheel(temp_path)
-            print(f"   Created: {wheel_path}")
-            print(f"   Size: {wheel_path.stat().st_size:,} bytes")
-
-            # Step 2: Edit the wheel using WheelEditor
-            print("\n2. Editing wheel with WheelEditor...")
-            editor = WheelEditor(str(wheel_path))
-
-            print("   Original metadata:")
-            print(f"     Name: {editor.name}")
-            print(f"     Version: {editor.version}")
-            print(f"     Summary: {editor.summary}")
-            print(f"     Author: {editor.author}")
-
-            # Make edits
-            editor.version = "1.0.1"
-            editor.summary = "Modified test package - validated by wheel editor"
-            editor.author = "Wheel Editor Test Suite"
-            editor.set_metadata("Home-page", "https://example.com/wheel-editor-test")
-
-            # Add classifiers
-            classifiers = editor.classifiers
-            classifiers.append("Development Status :: 4 - Beta")
-            classifiers.append("Topic :: Software Development :: Testing")
-            editor.classifiers = classifiers
-
-            # Add dependencies
-            deps = editor.requires_dist
-            deps.append("click>=8.0.0")
-            editor.requires_dist = deps
-
-            # Save edited wheel
-            edited_path = temp_path / "test_package-1.0.1-py3-none-any.whl"
-            editor.save(str(edited_path))
-            print(f"\n   Saved edited wheel: {edited_path}")
-            print(f"   Size: {edited_path.stat().st_size:,} bytes")
-
-            # Step 3: Verify changes were applied
-            print("\n3. Verifying changes...")
-            new_editor = WheelEditor(str(edited_path))
+    def test_e2e(self, test_wheel, tmp_path):
+        # Step 1: Create test wheel. Lazy %-style logging keeps these
+        # free when nobody asked for --log-cli-level=DEBUG.
+        logger.debug("created %s (%d bytes)", test_wheel, test_wheel.stat().st_size)
 
-            assert (
-                new_editor.version == "1.0.1"
-            ), f"Version not updated correctly: {new_editor.version}"
-            assert (
-                "validated by wheel editor" in new_editor.summary
-            ), f"Summary not updated correctly: {new_editor.summary}"
-            assert (
-                new_editor.author == "Wheel Editor Test Suite"
-            ), f"Author not updated correctly: {new_editor.author}"
-            assert (
-                "click>=8.0.0" in new_editor.requires_dist
-            ), f"Dependencies not updated correctly: {new_editor.requires_dist}"
+        # Step 2: Edit the wheel using WheelEditor
+        editor = WheelEditor(str(test_wheel))
 
-            print("   ✅ All changes verified successfully!")
+        logger.debug(
+            "original metadata: name=%s version=%s summary=%s author=%s",
+            editor.name,
+            editor.version,
+            editor.summary,
+            editor.author,
+        )
+
+        # Make edits
+        editor.version = "1.0.1"
+        editor.summary = "Modified test package - validated by wheel editor"
+        editor.author = "Wheel Editor Test Suite"
+        editor.set_metadata("Home-page", "https://example.com/wheel-editor-test")
+
+        # Add classifiers
+        classifiers = editor.classifiers
+        classifiers.append("Development Status :: 4 - Beta")
+        classifiers.append("Topic :: Software Development :: Testing")
+        editor.classifiers = classifiers
+
+        # Add dependencies
+        deps = editor.requires_dist
+        deps.append("click>=8.0.0")
+        editor.requires_dist = deps
+
+        # Save edited wheel
+        edited_path = tmp_path / "test_package-1.0.1-py3-none-any.whl"
+        editor.save(str(edited_path))
+        logger.debug(
+            "saved edited wheel %s (%d bytes)", edited_path, edited_path.stat().st_size
+        )
+
+        # Step 3: Verify changes were applied
+        new_editor = WheelEditor(str(edited_path))
+
+        assert (
+            new_editor.version == "1.0.1"
+        ), f"Version not updated correctly: {new_editor.version}"
+        assert (
+            "validated by wheel editor" in new_editor.summary
+        ), f"Summary not updated correctly: {new_editor.summary}"
+        assert (
+            new_editor.author == "Wheel Editor Test Suite"
+        ), f"Author not updated correctly: {new_editor.author}"
+        assert (
+            "click>=8.0.0" in new_editor.requires_dist
+        ), f"Dependencies not updated correctly: {new_editor.requires_dist}"
 
 
 class TestHashPreservation:
     """Tests for hash preservation in saved wheels."""
 
-    def test_hash_preservation(self):
+    def test_hash_preservation(self, test_wheel, tmp_path):
         """Test that unchanged files maintain their original hashes."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            # Get original RECORD hashes
-            original_hashes = {}
-            with zipfile.ZipFile(test_wheel, "r") as zf:
-                for name in zf.namelist():
-                    if name.endswith("/RECORD"):
-                        with zf.open(name) as f:
-                            reader = csv.reader(io.StringIO(f.read().decode("utf-8")))
-                            for row in reader:
-                                if len(row) >= 2 and row[1]:
-                                    original_hashes[row[0]] = row[1]
-
-            # Edit and save
-            editor = WheelEditor(str(test_wheel))
-            editor.summary = "Hash preservation test"
-
-            output_path = temp_path / "preserved.whl"
-            editor.save(str(output_path))
-
-            # Check hashes of unchanged files
-            with zipfile.ZipFile(output_path, "r") as zf:
-                for name in zf.namelist():
-                    if name.endswith("/RECORD"):
-                        with zf.open(name) as f:
-                            reader = csv.reader(io.StringIO(f.read().decode("utf-8")))
-                            for row in reader:
-                                if len(row) >= 2 and row[1]:
-                                    # Unchanged files should have same hash
-                                    if not row[0].endswith("/METADATA"):
-                                        if row[0] in original_hashes:
-                                            assert (
-                                                row[1] == original_hashes[row[0]]
-                                            ), f"Hash changed for {row[0]}"
+
+        # Get original RECORD hashes. Find RECORD via NameToInfo rather
+        # than scanning a namelist() copy.
+        original_hashes = {}
+        with zipfile.ZipFile(test_wheel, "r") as zf:
+            record_name = next(n for n in zf.NameToInfo if n.endswith("/RECORD"))
+            with zf.open(record_name) as f:
+                for row in _iter_record(f):
+                    if len(row) >= 2 and row[1]:
+                        original_hashes[row[0]] = row[1]
+
+        # Edit and save
+        editor = WheelEditor(str(test_wheel))
+        editor.summary = "Hash preservation test"
+
+        output_path = tmp_path / "preserved.whl"
+        editor.save(str(output_path))
+
+        # Check hashes of unchanged files
+        with zipfile.ZipFile(output_path, "r") as zf:
+            record_name = next(n for n in zf.NameToInfo if n.endswith("/RECORD"))
+            with zf.open(record_name) as f:
+                for row in _iter_record(f):
+                    if len(row) >= 2 and row[1]:
+                        # Unchanged files should have same hash
+                        if not row[0].endswith("/METADATA"):
+                            if row[0] in original_hashes:
+                                assert (
+                                    row[1] == original_hashes[row[0]]
+                                ), f"Hash changed for {row[0]}"
 
 
 class TestPlatformTag:
     """Tests for platform tag functionality."""
 
-    def test_get_platform_tag_pure_python(self):
+    def test_get_platform_tag_pure_python(self, editor):
         """Test getting platform tag from a pure Python wheel."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        # Pure Python wheel has "any" as platform
+        platform = editor.platform_tag
+        assert platform == "any"
 
-            # Pure Python wheel has "any" as platform
-            platform = editor.platform_tag
-            assert platform == "any"
-
-    def test_set_platform_tag(self):
+    def test_set_platform_tag(self, editor, tmp_path):
         """Test setting platform tag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
 
-            # Set a new platform tag
-            editor.platform_tag = "manylinux_2_28_x86_64"
-            assert editor.platform_tag == "manylinux_2_28_x86_64"
+        # Set a new platform tag
+        editor.platform_tag = "manylinux_2_28_x86_64"
+        assert editor.platform_tag == "manylinux_2_28_x86_64"
 
-            # Save and verify persistence
-            output_path = temp_path / "edited.whl"
-            editor.save(str(output_path))
+        # Save and verify persistence
+        output_path = tmp_path / "edited.whl"
+        editor.save(str(output_path))
 
-            new_editor = WheelEditor(str(output_path))
-            assert new_editor.platform_tag == "manylinux_2_28_x86_64"
+        new_editor = WheelEditor(str(output_path))
+        assert new_editor.platform_tag == "manylinux_2_28_x86_64"
 
 
 class TestRpathOperations:
     """Tests for RPATH operations on ELF files."""
 
-    def test_set_rpath_no_so_files(self):
+    def test_set_rpath_no_so_files(self, editor):
         """Test set_rpath on a wheel with no .so files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        # This should return 0 (no files modified) since pure Python wheel has no .so files
+        count = editor.set_rpath("*.so", "$ORIGIN")
+        assert count == 0
+        assert not editor.has_modified_files()
 
-            # This should return 0 (no files modified) since pure Python wheel has no .so files
-            count = editor.set_rpath("*.so", "$ORIGIN")
-            assert count == 0
-            assert not editor.has_modified_files()
-
-    def test_has_modified_files(self):
+    def test_has_modified_files(self, editor):
         """Test has_modified_files() method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            editor = WheelEditor(str(test_wheel))
 
-            # Initially no modified files
-            assert not editor.has_modified_files()
+        # Initially no modified files
+        assert not editor.has_modified_files()
 
-            # After failed RPATH set (no matching files), still no modified files
-            editor.set_rpath("nonexistent/*.so", "$ORIGIN")
-            assert not editor.has_modified_files()
+        # After failed RPATH set (no matching files), still no modified files
+        editor.set_rpath("nonexistent/*.so", "$ORIGIN")
+        assert not editor.has_modified_files()
 
 
 class TestAddRequiresDist:
     """Tests for add_requires_dist method."""
 
-    def test_add_requires_dist(self):
+    def test_add_requires_dist(self, editor, tmp_path):
         """Test adding a dependency using add_requires_dist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
+        original_count = len(editor.requires_dist)
 
-            original_count = len(editor.requires_dist)
+        # Add a new dependency
+        editor.add_requires_dist("nccl-lib>=1.0")
 
-            # Add a new dependency
-            editor.add_requires_dist("nccl-lib>=1.0")
+        assert len(editor.requires_dist) == original_count + 1
+        assert "nccl-lib>=1.0" in editor.requires_dist
 
-            assert len(editor.requires_dist) == original_count + 1
-            assert "nccl-lib>=1.0" in editor.requires_dist
+        # Save and verify persistence
+        output_path = tmp_path / "edited.whl"
+        editor.save(str(output_path))
 
-            # Save and verify persistence
-            output_path = temp_path / "edited.whl"
-            editor.save(str(output_path))
+        new_editor = WheelEditor(str(output_path))
+        assert "nccl-lib>=1.0" in new_editor.requires_dist
 
-            new_editor = WheelEditor(str(output_path))
-            assert "nccl-lib>=1.0" in new_editor.requires_dist
+
+class TestExtendListFields:
+    """Tests for extend_classifiers / extend_requires_dist."""
+
+    def test_extend_classifiers(self, editor):
+        """Test appending several classifiers in one call."""
+
+        original_count = len(editor.classifiers)
+
+        editor.extend_classifiers(
+            [
+                "Development Status :: 4 - Beta",
+                "Topic :: Software Development :: Testing",
+            ]
+        )
+
+        assert len(editor.classifiers) == original_count + 2
+        assert "Development Status :: 4 - Beta" in editor.classifiers
+
+    def test_extend_requires_dist(self, editor):
+        """Test appending several dependencies in one call."""
+
+        editor.extend_requires_dist(["click>=8.0.0", "nccl-lib>=1.0"])
+
+        assert "click>=8.0.0" in editor.requires_dist
+        assert "nccl-lib>=1.0" in editor.requires_dist
+
+
+class TestCsvSetters:
+    """Tests for set_classifiers_csv / set_requires_dist_csv."""
+
+    def test_set_classifiers_csv(self, editor):
+        """Test replacing classifiers from a comma-separated string."""
+
+        editor.set_classifiers_csv(
+            "Development Status :: 4 - Beta, Environment :: Console,"
+        )
+
+        assert editor.classifiers == [
+            "Development Status :: 4 - Beta",
+            "Environment :: Console",
+        ]
+
+    def test_set_requires_dist_csv(self, editor):
+        """Test replacing dependencies from a comma-separated string."""
+
+        editor.set_requires_dist_csv(" click>=8.0.0 ,numpy ")
+
+        assert editor.requires_dist == ["click>=8.0.0", "numpy"]
 
 
 class TestCLI:
@@ -789,359 +759,303 @@ class TestCLI:
         assert result.exit_code == 0
         assert "wheel metadata editor" in result.output.lower()
 
-    def test_cli_show(self):
+    def test_cli_show(self, test_wheel):
         """Test CLI show command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            result = self._run_cli(["show", str(test_wheel)])
+        result = self._run_cli(["show", str(test_wheel)])
 
-            assert result.exit_code == 0
-            assert "test-package" in result.output
-            assert "1.0.0" in result.output
+        assert result.exit_code == 0
+        assert "test-package" in result.output
+        assert "1.0.0" in result.output
 
-    def test_cli_edit_version(self):
+    def test_cli_edit_version(self, test_wheel, tmp_path):
         """Test CLI edit command to change version."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-            output_path = temp_path / "edited.whl"
+        output_path = tmp_path / "edited.whl"
 
-            result = self._run_cli(
-                ["edit", str(test_wheel), "--version", "2.0.0", "-o", str(output_path)],
-            )
+        result = self._run_cli(
+            ["edit", str(test_wheel), "--version", "2.0.0", "-o", str(output_path)],
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Verify the change
-            editor = WheelEditor(str(output_path))
-            assert editor.version == "2.0.0"
+        # Verify the change
+        editor = WheelEditor(str(output_path))
+        assert editor.version == "2.0.0"
 
-    def test_cli_edit_platform_tag(self):
+    def test_cli_edit_platform_tag(self, test_wheel, tmp_path):
         """Test CLI edit command to change platform tag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-            output_path = temp_path / "edited.whl"
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--platform-tag",
-                    "manylinux_2_28_x86_64",
-                    "-o",
-                    str(output_path),
-                ],
-            )
+        output_path = tmp_path / "edited.whl"
+
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--platform-tag",
+                "manylinux_2_28_x86_64",
+                "-o",
+                str(output_path),
+            ],
+        )
 
-            assert result.exit_code == 0
-            assert "platform tag" in result.output.lower()
+        assert result.exit_code == 0
+        assert "platform tag" in result.output.lower()
 
-            # Verify the change
-            editor = WheelEditor(str(output_path))
-            assert editor.platform_tag == "manylinux_2_28_x86_64"
+        # Verify the change
+        editor = WheelEditor(str(output_path))
+        assert editor.platform_tag == "manylinux_2_28_x86_64"
 
-    def test_cli_edit_python_tag(self):
+    def test_cli_edit_python_tag(self, test_wheel, tmp_path):
         """Test CLI edit command to change python tag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-            output_path = temp_path / "edited.whl"
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--python-tag",
-                    "cp312",
-                    "-o",
-                    str(output_path),
-                ],
-            )
+        output_path = tmp_path / "edited.whl"
+
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--python-tag",
+                "cp312",
+                "-o",
+                str(output_path),
+            ],
+        )
 
-            assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
-            assert "python tag" in result.output.lower()
+        assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
+        assert "python tag" in result.output.lower()
 
-            # Verify the change
-            editor = WheelEditor(str(output_path))
-            assert editor.python_tag == "cp312"
-            # Other components should be unchanged
-            assert editor.abi_tag == "none", "abi tag should be unchanged"
-            assert editor.platform_tag == "any", "platform tag should be unchanged"
+        # Verify the change
+        editor = WheelEditor(str(output_path))
+        assert editor.python_tag == "cp312"
+        # Other components should be unchanged
+        assert editor.abi_tag == "none", "abi tag should be unchanged"
+        assert editor.platform_tag == "any", "platform tag should be unchanged"
 
-    def test_cli_edit_abi_tag(self):
+    def test_cli_edit_abi_tag(self, test_wheel, tmp_path):
         """Test CLI edit command to change ABI tag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-            output_path = temp_path / "edited.whl"
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--abi-tag",
-                    "cp312",
-                    "-o",
-                    str(output_path),
-                ],
-            )
+        output_path = tmp_path / "edited.whl"
+
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--abi-tag",
+                "cp312",
+                "-o",
+                str(output_path),
+            ],
+        )
 
-            assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
-            assert "abi tag" in result.output.lower()
+        assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
+        assert "abi tag" in result.output.lower()
 
-            # Verify the change
-            editor = WheelEditor(str(output_path))
-            assert editor.abi_tag == "cp312"
-            # Other components should be unchanged
-            assert editor.python_tag == "py3", "python tag should be unchanged"
-            assert editor.platform_tag == "any", "platform tag should be unchanged"
+        # Verify the change
+        editor = WheelEditor(str(output_path))
+        assert editor.abi_tag == "cp312"
+        # Other components should be unchanged
+        assert editor.python_tag == "py3", "python tag should be unchanged"
+        assert editor.platform_tag == "any", "platform tag should be unchanged"
 
-    def test_cli_edit_output_dir(self):
+    def test_cli_edit_output_dir(self, test_wheel, tmp_path):
         """Test CLI edit with -o pointing to a directory uses computed filename."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-            output_dir = temp_path / "output"
-            output_dir.mkdir()
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--python-tag",
-                    "cp312",
-                    "--abi-tag",
-                    "cp312",
-                    "-o",
-                    str(output_dir),
-                ],
-            )
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--python-tag",
+                "cp312",
+                "--abi-tag",
+                "cp312",
+                "-o",
+                str(output_dir),
+            ],
+        )
 
-            assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
+        assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
 
-            # Should have saved with the computed PEP 427 filename
-            expected_path = output_dir / "test_package-1.0.0-cp312-cp312-any.whl"
-            assert expected_path.exists(), (
-                f"Expected wheel at {expected_path}, "
-                f"got files: {list(output_dir.iterdir())}"
-            )
-            assert str(expected_path) in result.output
+        # Should have saved with the computed PEP 427 filename
+        expected_path = output_dir / "test_package-1.0.0-cp312-cp312-any.whl"
+        assert expected_path.exists(), (
+            f"Expected wheel at {expected_path}, "
+            f"got files: {list(output_dir.iterdir())}"
+        )
+        assert str(expected_path) in result.output
 
-    def test_cli_show_json(self):
+    def test_cli_show_json(self, test_wheel):
         """Test CLI show command with JSON output."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            result = self._run_cli(["show", str(test_wheel), "--json"])
+        result = self._run_cli(["show", str(test_wheel), "--json"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Parse JSON output
-            import json
+        # Parse JSON output
+        import json
 
-            data = json.loads(result.output)
-            assert data["name"] == "test-package"
-            assert data["version"] == "1.0.0"
-            assert "platform_tag" in data
-            assert data["dist_info_dir"] == "test_package-1.0.0.dist-info"
+        data = json.loads(result.output)
+        assert data["name"] == "test-package"
+        assert data["version"] == "1.0.0"
+        assert "platform_tag" in data
+        assert data["dist_info_dir"] == "test_package-1.0.0.dist-info"
 
-    def test_cli_edit_add_file(self):
+    def test_cli_edit_add_file(self, test_wheel, tmp_path):
         """--add-file injects a file at the given archive path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            src = temp_path / "build-details.json"
-            src.write_text('{"vcs_name":"git","vcs_ref":"abc123"}')
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--add-file",
-                    "test_package-1.0.0.dist-info/build-details.json",
-                    str(src),
-                ]
+
+        src = tmp_path / "build-details.json"
+        src.write_text('{"vcs_name":"git","vcs_ref":"abc123"}')
+
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--add-file",
+                "test_package-1.0.0.dist-info/build-details.json",
+                str(src),
+            ]
+        )
+        assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
+
+        with zipfile.ZipFile(test_wheel) as zf:
+            names = zf.namelist()
+            assert "test_package-1.0.0.dist-info/build-details.json" in names
+            assert (
+                zf.read(
+                    "test_package-1.0.0.dist-info/build-details.json"
+                ).decode()
+                == '{"vcs_name":"git","vcs_ref":"abc123"}'
             )
-            assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
-
-            with zipfile.ZipFile(test_wheel) as zf:
-                names = zf.namelist()
-                assert "test_package-1.0.0.dist-info/build-details.json" in names
-                assert (
-                    zf.read(
-                        "test_package-1.0.0.dist-info/build-details.json"
-                    ).decode()
-                    == '{"vcs_name":"git","vcs_ref":"abc123"}'
-                )
-
-            # Roundtrip through WheelEditor.validate to ensure RECORD is correct.
-            editor = WheelEditor(str(test_wheel))
-            assert editor.dist_info_dir == "test_package-1.0.0.dist-info"
-
-    def test_cli_edit_add_dist_info_file(self):
+
+        # Roundtrip through WheelEditor.validate to ensure RECORD is correct.
+        editor = WheelEditor(str(test_wheel))
+        assert editor.dist_info_dir == "test_package-1.0.0.dist-info"
+
+    def test_cli_edit_add_dist_info_file(self, test_wheel, tmp_path):
         """--add-dist-info-file resolves the dist-info prefix automatically."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            src = temp_path / "details.json"
-            src.write_bytes(b'{"key":"val"}')
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--add-dist-info-file",
-                    "build-details.json",
-                    str(src),
-                ]
-            )
-            assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
 
-            with zipfile.ZipFile(test_wheel) as zf:
-                assert (
-                    zf.read("test_package-1.0.0.dist-info/build-details.json")
-                    == b'{"key":"val"}'
-                )
+        src = tmp_path / "details.json"
+        src.write_bytes(b'{"key":"val"}')
 
-    def test_cli_add_dist_info_file_rejects_nested_path(self):
-        """--add-dist-info-file should reject paths containing slashes."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            src = temp_path / "details.json"
-            src.write_bytes(b"{}")
-
-            result = self._run_cli(
-                [
-                    "edit",
-                    str(test_wheel),
-                    "--add-dist-info-file",
-                    "nested/build-details.json",
-                    str(src),
-                ]
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--add-dist-info-file",
+                "build-details.json",
+                str(src),
+            ]
+        )
+        assert result.exit_code == 0, f"CLI failed: {result.output}{result.stderr}"
+
+        with zipfile.ZipFile(test_wheel) as zf:
+            assert (
+                zf.read("test_package-1.0.0.dist-info/build-details.json")
+                == b'{"key":"val"}'
             )
-            assert result.exit_code != 0
-            assert "leaf filename" in result.stderr
+
+    def test_cli_add_dist_info_file_rejects_nested_path(self, test_wheel, tmp_path):
+        """--add-dist-info-file should reject paths containing slashes."""
+
+        src = tmp_path / "details.json"
+        src.write_bytes(b"{}")
+
+        result = self._run_cli(
+            [
+                "edit",
+                str(test_wheel),
+                "--add-dist-info-file",
+                "nested/build-details.json",
+                str(src),
+            ]
+        )
+        assert result.exit_code != 0
+        assert "leaf filename" in result.stderr
 
 
 class TestAddFile:
     """Tests for the WheelEditor.add_file Python API."""
 
-    def test_add_file_appears_in_archive(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
+    def test_add_file_appears_in_archive(self, editor, tmp_path):
 
-            editor = WheelEditor(str(test_wheel))
-            payload = b'{"vcs_name":"hg","vcs_ref":"deadbeef"}'
-            editor.add_file(
-                f"{editor.dist_info_dir}/build-details.json", payload
-            )
-            assert editor.has_added_files()
-            output = temp_path / "out.whl"
-            editor.save(str(output))
+        payload = b'{"vcs_name":"hg","vcs_ref":"deadbeef"}'
+        editor.add_file(
+            f"{editor.dist_info_dir}/build-details.json", payload
+        )
+        assert editor.has_added_files()
+        output = tmp_path / "out.whl"
+        editor.save(str(output))
 
-            with zipfile.ZipFile(output) as zf:
-                assert (
-                    zf.read("test_package-1.0.0.dist-info/build-details.json")
-                    == payload
-                )
+        with zipfile.ZipFile(output) as zf:
+            assert (
+                zf.read("test_package-1.0.0.dist-info/build-details.json")
+                == payload
+            )
 
-    def test_add_file_collision_raises(self):
+    def test_add_file_collision_raises(self, editor, tmp_path):
         """add_file colliding with an existing source file should error at save."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
-            editor.add_file("test_package/__init__.py", b"# overwrite\n")
+        editor.add_file("test_package/__init__.py", b"# overwrite\n")
 
-            with pytest.raises(ValueError, match="collides"):
-                editor.save(str(temp_path / "out.whl"))
+        with pytest.raises(ValueError, match="collides"):
+            editor.save(str(tmp_path / "out.whl"))
 
-    def test_add_file_collision_with_record_raises(self):
+    def test_add_file_collision_with_record_raises(self, editor, tmp_path):
         """add_file at RECORD path should error at save."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
-            editor.add_file(
-                "test_package-1.0.0.dist-info/RECORD", b"bogus\n"
-            )
+        editor.add_file(
+            "test_package-1.0.0.dist-info/RECORD", b"bogus\n"
+        )
 
-            with pytest.raises(ValueError, match="generated dist-info"):
-                editor.save(str(temp_path / "out.whl"))
+        with pytest.raises(ValueError, match="generated dist-info"):
+            editor.save(str(tmp_path / "out.whl"))
 
-    def test_dist_info_dir_reflects_metadata(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
+    def test_dist_info_dir_reflects_metadata(self, editor):
 
-            editor = WheelEditor(str(test_wheel))
-            assert editor.dist_info_dir == "test_package-1.0.0.dist-info"
-            editor.version = "2.5.0"
-            assert editor.dist_info_dir == "test_package-2.5.0.dist-info"
+        assert editor.dist_info_dir == "test_package-1.0.0.dist-info"
+        editor.version = "2.5.0"
+        assert editor.dist_info_dir == "test_package-2.5.0.dist-info"
 
 
 class TestValidate:
     """Tests for WheelEditor.validate (Python binding)."""
 
-    def test_validate_valid_wheel(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
+    def test_validate_valid_wheel(self, test_wheel):
 
-            result = WheelEditor(str(test_wheel)).validate()
-            assert result.is_valid
-            assert result.errors == []
-            assert bool(result) is True
-            assert "valid=True" in repr(result)
+        result = WheelEditor(str(test_wheel)).validate()
+        assert result.is_valid
+        assert result.errors == []
+        assert bool(result) is True
+        assert "valid=True" in repr(result)
 
-    def test_validate_after_add_file_roundtrip(self):
+    def test_validate_after_add_file_roundtrip(self, editor, tmp_path):
         """Adding a file via add_file must produce a wheel that validates."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
 
-            editor = WheelEditor(str(test_wheel))
-            editor.add_file(
-                f"{editor.dist_info_dir}/build-details.json", b'{"x":1}'
-            )
-            output = temp_path / "out.whl"
-            editor.save(str(output))
+        editor.add_file(
+            f"{editor.dist_info_dir}/build-details.json", b'{"x":1}'
+        )
+        output = tmp_path / "out.whl"
+        editor.save(str(output))
 
-            result = WheelEditor(str(output)).validate()
-            assert result.is_valid, f"errors: {result.errors}"
+        result = WheelEditor(str(output)).validate()
+        assert result.is_valid, f"errors: {result.errors}"
 
-    def test_validate_detects_corruption(self):
+    def test_validate_detects_corruption(self, test_wheel, tmp_path):
         """A wheel whose RECORD doesn't match its contents should fail."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            # Corrupt the wheel by overwriting __init__.py without updating RECORD.
-            with zipfile.ZipFile(test_wheel) as zf:
-                names = zf.namelist()
-                contents = {n: zf.read(n) for n in names}
-            contents["test_package/__init__.py"] = b"# corrupted\n"
-            corrupted = temp_path / "corrupted.whl"
-            with zipfile.ZipFile(corrupted, "w", zipfile.ZIP_DEFLATED) as zf:
-                for n, c in contents.items():
-                    zf.writestr(n, c)
-
-            result = WheelEditor(str(corrupted)).validate()
-            assert not result.is_valid
-            assert bool(result) is False
-            assert any("hash mismatch" in e for e in result.errors)
-            assert any("__init__.py" in e for e in result.errors)
+
+        # Corrupt the wheel by overwriting __init__.py without updating RECORD.
+        with zipfile.ZipFile(test_wheel) as zf:
+            names = zf.namelist()
+            contents = {n: zf.read(n) for n in names}
+        contents["test_package/__init__.py"] = b"# corrupted\n"
+        corrupted = tmp_path / "corrupted.whl"
+        with zipfile.ZipFile(corrupted, "w", zipfile.ZIP_DEFLATED) as zf:
+            for n, c in contents.items():
+                zf.writestr(n, c)
+
+        result = WheelEditor(str(corrupted)).validate()
+        assert not result.is_valid
+        assert bool(result) is False
+        assert any("hash mismatch" in e for e in result.errors)
+        assert any("__init__.py" in e for e in result.errors)
 
 
 class TestCLIValidate:
@@ -1170,44 +1084,35 @@ class TestCLIValidate:
             stderr=stderr_buf.getvalue(),
         )
 
-    def test_cli_validate_ok(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            result = self._run_cli(["validate", str(test_wheel)])
-            assert result.exit_code == 0
-            assert "OK" in result.output
-
-    def test_cli_validate_json_ok(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            result = self._run_cli(["validate", str(test_wheel), "--json"])
-            assert result.exit_code == 0
-
-            import json
-
-            data = json.loads(result.output)
-            assert data["is_valid"] is True
-            assert data["errors"] == []
-
-    def test_cli_validate_fail(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_wheel = create_test_wheel(temp_path)
-
-            with zipfile.ZipFile(test_wheel) as zf:
-                names = zf.namelist()
-                contents = {n: zf.read(n) for n in names}
-            contents["test_package/__init__.py"] = b"# corrupted\n"
-            corrupted = temp_path / "corrupted.whl"
-            with zipfile.ZipFile(corrupted, "w", zipfile.ZIP_DEFLATED) as zf:
-                for n, c in contents.items():
-                    zf.writestr(n, c)
-
-            result = self._run_cli(["validate", str(corrupted)])
-            assert result.exit_code == 1
-            assert "FAIL" in result.stderr
-            assert "hash mismatch" in result.stderr
+    def test_cli_validate_ok(self, test_wheel):
+
+        result = self._run_cli(["validate", str(test_wheel)])
+        assert result.exit_code == 0
+        assert "OK" in result.output
+
+    def test_cli_validate_json_ok(self, test_wheel):
+
+        result = self._run_cli(["validate", str(test_wheel), "--json"])
+        assert result.exit_code == 0
+
+        import json
+
+        data = json.loads(result.output)
+        assert data["is_valid"] is True
+        assert data["errors"] == []
+
+    def test_cli_validate_fail(self, test_wheel, tmp_path):
+
+        with zipfile.ZipFile(test_wheel) as zf:
+            names = zf.namelist()
+            contents = {n: zf.read(n) for n in names}
+        contents["test_package/__init__.py"] = b"# corrupted\n"
+        corrupted = tmp_path / "corrupted.whl"
+        with zipfile.ZipFile(corrupted, "w", zipfile.ZIP_DEFLATED) as zf:
+            for n, c in contents.items():
+                zf.writestr(n, c)
+
+        result = self._run_cli(["validate", str(corrupted)])
+        assert result.exit_code == 1
+        assert "FAIL" in result.stderr
+        assert "hash mismatch" in result.stderr
@@ -14,16 +14,25 @@ Usage:
 import base64
 import csv
 import hashlib
+import http.client
 import io
+import logging
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
-import urllib.request
+import threading
+import urllib.parse
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import BytesHeaderParser
 from pathlib import Path
 
 import pytest
-from editwheel import WheelEditor
+from editwheel import normalize_dist_info_name, WheelEditor
+
+logger = logging.getLogger(__name__)
 
 # Small, pure-Python wheels that are good for testing
 TEST_WHEELS = [
@@ -44,6 +53,11 @@ TEST_WHEELS = [
     },
 ]
 
+# Derive each wheel's filename once instead of re-splitting the URL in
+# every fixture and test
+for _w in TEST_WHEELS:
+    _w["filename"] = _w["url"].rsplit("/", 1)[-1]
+
 
 @pytest.fixture
 def temp_dir():
@@ -52,16 +66,116 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def wheel_cache(tmp_path_factory) -> Path:
+    """Session-wide download cache so each wheel is fetched only once.
+
+    Wheels found in $EDITWHEEL_OFFLINE_WHEELS (a directory of
+    pre-downloaded wheels) seed the cache without touching the network;
+    anything still missing is prefetched concurrently, so the download
+    phase costs the slowest single fetch instead of the sum.
+    """
+    cache = tmp_path_factory.mktemp("wheels")
+
+    to_fetch = TEST_WHEELS
+    offline_dir = os.environ.get("EDITWHEEL_OFFLINE_WHEELS")
+    if offline_dir:
+        to_fetch = []
+        for wheel in TEST_WHEELS:
+            offline_path = Path(offline_dir) / wheel["filename"]
+            if offline_path.exists():
+                shutil.copy2(offline_path, cache / wheel["filename"])
+            else:
+                to_fetch.append(wheel)
+
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=len(to_fetch)) as ex:
+            list(
+                ex.map(
+                    lambda w: download_wheel(w["url"], cache / w["filename"]),
+                    to_fetch,
+                )
+            )
+    return cache
+
+
+# All TEST_WHEELS live on files.pythonhosted.org; keeping one
+# keep-alive connection per host skips the extra TCP + TLS handshakes
+# urlretrieve would pay on every download. Connections are per-thread
+# since http.client is not safe to share across the prefetch pool.
+_LOCAL = threading.local()
+
+
+def _get_streaming(url: str):
+    """Issue a GET over a cached per-host keep-alive connection."""
+    connections = getattr(_LOCAL, "connections", None)
+    if connections is None:
+        connections = _LOCAL.connections = {}
+    parsed = urllib.parse.urlsplit(url)
+    for attempt in (0, 1):
+        conn = connections.get(parsed.netloc)
+        if conn is None:
+            conn = connections[parsed.netloc] = http.client.HTTPSConnection(
+                parsed.netloc
+            )
+        try:
+            conn.request("GET", parsed.path)
+            resp = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Server closed the idle connection; reconnect once
+            conn.close()
+            connections.pop(parsed.netloc, None)
+            if attempt:
+                raise
+            continue
+        if resp.status != 200:
+            resp.read()
+            raise RuntimeError(f"GET {url} returned {resp.status}")
+        return resp
+
+
 def download_wheel(url: str, dest_path: Path) -> Path:
     """Download a wheel from URL."""
-    print(f"Downloading: {url}")
-    print(f"         to: {dest_path}")
+    logger.info("downloading %s -> %s", url, dest_path)
+
+    resp = _get_streaming(url)
+    with open(dest_path, "wb") as f:
+        shutil.copyfileobj(resp, f, 1 << 20)
+    logger.info("downloaded %d bytes", dest_path.stat().st_size)
+    return dest_path
+
+
+def get_wheel(wheel_info: dict, cache: Path, dest_dir: Path) -> Path:
+    """Copy a cached TEST_WHEELS entry into `dest_dir`, downloading on first use.
 
-    urllib.request.urlretrieve(url, dest_path)
-    print(f"✅ Downloaded successfully ({dest_path.stat().st_size:,} bytes)")
+    Four tests per wheel each want their own mutable copy; routing them
+    through the cache turns twelve downloads into three plus cheap local
+    copies.
+    """
+    cached = cache / wheel_info["filename"]
+    if not cached.exists():
+        download_wheel(wheel_info["url"], cached)
+    dest_path = dest_dir / cached.name
+    # copy2 preserves mtime, so copies of the same cached wheel share a
+    # validation-cache key below
+    shutil.copy2(cached, dest_path)
     return dest_path
 
 
+def read_metadata_headers(wheel_path: Path):
+    """Parse just *.dist-info/METADATA out of a wheel.
+
+    Read-back assertions only need a few headers, so this opens the one
+    member instead of paying a full WheelEditor load.
+    """
+    with zipfile.ZipFile(wheel_path, "r") as zf:
+        meta_name = next(
+            n for n in zf.NameToInfo if n.endswith(".dist-info/METADATA")
+        )
+        with zf.open(meta_name) as f:
+            return BytesHeaderParser().parse(f)
+
+
 def generate_edited_wheel_filename(original_filename: str) -> str:
     """
     Generate a valid wheel filename for the edited version.
@@ -69,13 +183,16 @@ def generate_edited_wheel_filename(original_filename: str) -> str:
     Wheel filenames follow the format:
     {distribution}-{version}(-{build tag})?-{python}-{abi}-{platform}.whl
     """
-    # Parse the original filename
-    name_parts = original_filename.replace(".whl", "").split("-")
+    # Parse the original filename. maxsplit=4 keeps the version at
+    # index 1 even for build-tag wheels, and removesuffix only strips
+    # the actual extension.
+    stem = original_filename.removesuffix(".whl")
+    name_parts = stem.split("-", 4)
 
     if len(name_parts) < 5:
         # For pure Python wheels like: six-1.16.0-py2.py3-none-any.whl
         # Parts: ['six', '1.16.0', 'py2.py3', 'none', 'any']
-        return original_filename.replace(".whl", "_edited.whl")
+        return f"{stem}_edited.whl"
 
     # Modify the version part to add +edited
     name_parts[1] = f"{name_parts[1]}+edited"
@@ -84,31 +201,120 @@ def generate_edited_wheel_filename(original_filename: str) -> str:
     return "-".join(name_parts) + ".whl"
 
 
+def _verify_members(wheel_path: Path, entries: list) -> bool:
+    """Verify a batch of (path, expected_hash, size_str) RECORD rows.
+
+    Opens its own ZipFile: member reads on a shared handle serialize on
+    an internal lock, so each worker thread gets a private one. Walks
+    the central directory once instead of a keyed zf.open per row, so
+    each member's ZipInfo (including file_size) comes along for free.
+    """
+    wanted = {
+        path: (expected_hash, size_str) for path, expected_hash, size_str in entries
+    }
+    with zipfile.ZipFile(wheel_path, "r") as zf:
+        for info in zf.infolist():
+            checks = wanted.pop(info.filename, None)
+            if checks is None:
+                continue
+            expected_hash, size_str = checks
+
+            # Cheap check first: a size mismatch in the central
+            # directory fails the wheel without decompressing a byte
+            if size_str and info.file_size != int(size_str):
+                logger.debug("size mismatch for %s", info.filename)
+                return False
+
+            with zf.open(info) as entry:
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: the read loop runs in C with the
+                    # GIL released
+                    digest = hashlib.file_digest(entry, "sha256").digest()
+                else:
+                    # Stream in fixed-size chunks so peak memory
+                    # stays O(chunk) rather than O(largest file)
+                    hasher = hashlib.sha256()
+                    while chunk := entry.read(1 << 16):
+                        hasher.update(chunk)
+                    digest = hasher.digest()
+
+            # A 32-byte digest always encodes to 43 chars plus one
+            # "=" pad, so a fixed slice replaces the rstrip scan
+            actual_hash = base64.urlsafe_b64encode(digest)[:43]
+
+            if actual_hash != expected_hash:
+                logger.debug("hash mismatch for %s", info.filename)
+                return False
+
+    if wanted:
+        for path in wanted:
+            logger.debug("file not found: %s", path)
+        return False
+
+    return True
+
+
+# Validation results memoized by (filename, mtime_ns, size): several
+# tests validate their own pristine copy of the same cached wheel, and
+# the copies share mtime via copy2. Editing a wheel in place changes
+# mtime/size and naturally invalidates the entry.
+_VALIDATION_CACHE: dict = {}
+
+
 def validate_wheel_hashes(wheel_path: Path) -> bool:
     """Validate that all file hashes in RECORD match actual content."""
+    st = wheel_path.stat()
+    cache_key = (wheel_path.name, st.st_mtime_ns, st.st_size)
+    cached = _VALIDATION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    result = _validate_wheel_hashes_uncached(wheel_path)
+    _VALIDATION_CACHE[cache_key] = result
+    return result
+
+
+def _validate_wheel_hashes_uncached(wheel_path: Path) -> bool:
+    entries = []
     with zipfile.ZipFile(wheel_path, "r") as zf:
-        # Find RECORD file
-        record_path = None
-        for name in zf.namelist():
-            if name.endswith("/RECORD"):
-                record_path = name
-                break
+        # RECORD lives at a location derivable from the wheel filename,
+        # so try the direct lookup before scanning every member name
+        dist, version = wheel_path.name.split("-")[:2]
+        record_path = f"{normalize_dist_info_name(dist)}-{version}.dist-info/RECORD"
+        if record_path not in zf.NameToInfo:
+            record_path = next(
+                (n for n in zf.NameToInfo if n.endswith("/RECORD")), None
+            )
 
         if not record_path:
             return False
 
-        with zf.open(record_path) as f:
-            record_content = f.read().decode("utf-8")
-            reader = csv.reader(io.StringIO(record_content))
+        # Stream RECORD through a TextIOWrapper instead of materializing
+        # the whole file as bytes plus a str copy for StringIO
+        with zf.open(record_path) as f, io.TextIOWrapper(
+            f, encoding="utf-8", newline=""
+        ) as txt:
+            for line in txt:
+                line = line.rstrip("\r\n")
+                if not line:
+                    continue
+
+                if '"' in line:
+                    # Rare quoted path: let csv handle the escaping
+                    row = next(csv.reader([line]))
+                else:
+                    # Hash and size never contain commas, so rsplit
+                    # handles unquoted paths without the csv state
+                    # machine
+                    row = line.rsplit(",", 2)
 
-            for row in reader:
                 if len(row) < 3:
                     continue
 
                 path, hash_str, size_str = row[0], row[1], row[2]
 
-                # Skip RECORD itself
-                if path.endswith("/RECORD"):
+                # Skip RECORD itself — its exact path is already known,
+                # so a straight compare beats the suffix scan
+                if path == record_path:
                     continue
 
                 if not hash_str:
@@ -118,72 +324,44 @@ def validate_wheel_hashes(wheel_path: Path) -> bool:
                 if not hash_str.startswith("sha256="):
                     return False
 
-                expected_hash = hash_str[7:]  # Remove "sha256=" prefix
-
-                try:
-                    with zf.open(path) as entry:
-                        content = entry.read()
-                        actual_hash = (
-                            base64.urlsafe_b64encode(hashlib.sha256(content).digest())
-                            .decode("ascii")
-                            .rstrip("=")
-                        )
-
-                        if actual_hash != expected_hash:
-                            print(f"Hash mismatch for {path}")
-                            return False
-
-                        # Verify size
-                        if size_str and len(content) != int(size_str):
-                            print(f"Size mismatch for {path}")
-                            return False
-                except KeyError:
-                    print(f"File not found: {path}")
-                    return False
-
-    return True
+                # Remove "sha256=" prefix; keep as bytes so the compare
+                # against the encoded digest needs no str round-trip
+                entries.append((path, hash_str.encode("ascii")[7:], size_str))
 
+    if not entries:
+        return True
 
-@pytest.mark.parametrize(
-    "wheel_info", TEST_WHEELS, ids=[w["name"] for w in TEST_WHEELS]
-)
-class TestRealWheels:
-    """Test editing real wheels from PyPI."""
-
-    def test_wheel_download(self, wheel_info, temp_dir):
-        """Test that we can download wheels from PyPI."""
-        wheel_filename = wheel_info["url"].split("/")[-1]
-        wheel_path = temp_dir / wheel_filename
+    # Hashing releases the GIL, so members verify in parallel; each
+    # worker takes an interleaved slice of the entries
+    workers = min(len(entries), os.cpu_count() or 1)
+    if workers == 1:
+        return _verify_members(wheel_path, entries)
+    chunks = [entries[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return all(ex.map(lambda chunk: _verify_members(wheel_path, chunk), chunks))
 
-        downloaded = download_wheel(wheel_info["url"], wheel_path)
 
-        assert downloaded.exists()
-        assert downloaded.stat().st_size > 0
+@pytest.fixture(scope="session", params=TEST_WHEELS, ids=[w["name"] for w in TEST_WHEELS])
+def wheel_info(request):
+    """One TEST_WHEELS entry per parametrized run."""
+    return request.param
 
-    def test_original_wheel_valid(self, wheel_info, temp_dir):
-        """Test that original wheels from PyPI are valid."""
-        wheel_filename = wheel_info["url"].split("/")[-1]
-        wheel_path = temp_dir / wheel_filename
-        download_wheel(wheel_info["url"], wheel_path)
 
-        is_valid = validate_wheel_hashes(wheel_path)
-        assert is_valid, "Original wheel from PyPI should have valid hashes"
+@pytest.fixture(scope="session")
+def all_prepared_wheels(wheel_cache, tmp_path_factory):
+    """Map of name -> (original, edited) paths, built once per session.
 
-    def test_edit_wheel(self, wheel_info, temp_dir):
-        """Test that we can edit a wheel and maintain validity."""
-        # Download original wheel
-        wheel_filename = wheel_info["url"].split("/")[-1]
-        original_wheel = temp_dir / wheel_filename
-        download_wheel(wheel_info["url"], original_wheel)
-
-        # Validate original
-        assert validate_wheel_hashes(original_wheel), "Original wheel should be valid"
+    test_original_wheel_valid, test_edit_wheel and test_pip_compatibility
+    each repeated the download + edit + save flow; they only read the
+    artifacts, so one shared edit per wheel serves all three.
+    """
+    prepared = {}
+    for wheel_info in TEST_WHEELS:
+        work_dir = tmp_path_factory.mktemp(f"prepared_{wheel_info['name']}")
+        original_wheel = get_wheel(wheel_info, wheel_cache, work_dir)
 
-        # Edit the wheel
         editor = WheelEditor(str(original_wheel))
 
-        original_version = editor.version
-
         # Make modifications
         editor.version = f"{editor.version}+edited"
         if editor.summary:
@@ -200,10 +378,69 @@ class TestRealWheels:
         editor.classifiers = classifiers
 
         # Save edited wheel with proper filename
-        edited_filename = generate_edited_wheel_filename(wheel_filename)
-        edited_wheel = temp_dir / edited_filename
+        edited_filename = generate_edited_wheel_filename(original_wheel.name)
+        edited_wheel = work_dir / edited_filename
         editor.save(str(edited_wheel))
 
+        prepared[wheel_info["name"]] = (original_wheel, edited_wheel)
+
+    return prepared
+
+
+@pytest.fixture(scope="session")
+def prepared_wheel(wheel_info, all_prepared_wheels):
+    """Original plus edited paths for the current wheel."""
+    return all_prepared_wheels[wheel_info["name"]]
+
+
+@pytest.fixture(scope="session")
+def pip_dry_run(all_prepared_wheels):
+    """One pip --dry-run install over every edited wheel.
+
+    Each `python -m pip` spawn pays interpreter startup plus the pip
+    import; batching all edited wheels into a single invocation pays it
+    once for the whole session.
+    """
+    edited_wheels = [str(edited) for _, edited in all_prepared_wheels.values()]
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--dry-run",
+            "--no-deps",
+            *edited_wheels,
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestRealWheels:
+    """Test editing real wheels from PyPI."""
+
+    def test_wheel_download(self, wheel_info, temp_dir, wheel_cache):
+        """Test that we can download wheels from PyPI."""
+        downloaded = get_wheel(wheel_info, wheel_cache, temp_dir)
+
+        assert downloaded.exists()
+        assert downloaded.stat().st_size > 0
+
+    def test_original_wheel_valid(self, prepared_wheel):
+        """Test that original wheels from PyPI are valid."""
+        original_wheel, _ = prepared_wheel
+
+        is_valid = validate_wheel_hashes(original_wheel)
+        assert is_valid, "Original wheel from PyPI should have valid hashes"
+
+    def test_edit_wheel(self, prepared_wheel):
+        """Test that we can edit a wheel and maintain validity."""
+        original_wheel, edited_wheel = prepared_wheel
+
+        # Validate original
+        assert validate_wheel_hashes(original_wheel), "Original wheel should be valid"
+
         assert edited_wheel.exists(), "Edited wheel should be created"
 
         # Validate edited wheel
@@ -211,51 +448,28 @@ class TestRealWheels:
             edited_wheel
         ), "Edited wheel should have valid hashes"
 
-        # Verify metadata was changed
-        editor2 = WheelEditor(str(edited_wheel))
+        # Verify metadata was changed; reading METADATA directly skips
+        # a second full wheel load
+        original_version = read_metadata_headers(original_wheel)["Version"]
+        headers = read_metadata_headers(edited_wheel)
         assert (
-            editor2.version == f"{original_version}+edited"
+            headers["Version"] == f"{original_version}+edited"
         ), "Version should be updated"
-        assert editor2.summary is not None
+        assert headers["Summary"] is not None
         assert (
-            "Modified by editwheel-rs test" in editor2.summary
+            "Modified by editwheel-rs test" in headers["Summary"]
         ), "Summary should be updated"
 
-    def test_pip_compatibility(self, wheel_info, temp_dir):
+    def test_pip_compatibility(self, wheel_info, pip_dry_run):
         """Test that edited wheels are pip-compatible."""
-        # Download and edit wheel
-        wheel_filename = wheel_info["url"].split("/")[-1]
-        original_wheel = temp_dir / wheel_filename
-        download_wheel(wheel_info["url"], original_wheel)
-
-        editor = WheelEditor(str(original_wheel))
-        editor.version = f"{editor.version}+edited"
-
-        # Save with proper filename
-        edited_filename = generate_edited_wheel_filename(wheel_filename)
-        edited_wheel = temp_dir / edited_filename
-        editor.save(str(edited_wheel))
-
-        # Test pip install (dry run)
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "--dry-run",
-                "--no-deps",
-                str(edited_wheel),
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        pip_valid = result.returncode == 0 or "Would install" in result.stdout
+        pip_valid = pip_dry_run.returncode == 0 or "Would install" in pip_dry_run.stdout
 
         assert (
             pip_valid
-        ), f"Edited wheel should be pip-compatible. Error: {result.stderr}"
+        ), f"Edited wheel should be pip-compatible. Error: {pip_dry_run.stderr}"
+        # The batch dry run covers all edited wheels; check this one
+        # made it into the resolution
+        assert wheel_info["name"] in pip_dry_run.stdout
 
 
 if __name__ == "__main__":